@@ -5,14 +5,17 @@ sample size, effect size or significance level of a wide array of statistical
 tests.
 """
 
-from effect_size import (
+from .effect_size import (
     es_h,
     es_w1,
     es_w2,
     cohen_es,
 )
-from pwr_tests import (
+from .pwr_tests import (
+    clear_pwr_caches,
+    pwr_map,
     pwr_2p_test,
+    pwr_2p_grid,
     pwr_2p2n_test,
     pwr_anova_test,
     pwr_chisq_test,
@@ -29,7 +32,10 @@ __all__ = [
     "es_w1",
     "es_w2",
     "cohen_es",
+    "clear_pwr_caches",
+    "pwr_map",
     "pwr_2p_test",
+    "pwr_2p_grid",
     "pwr_2p2n_test",
     "pwr_anova_test",
     "pwr_chisq_test",
@@ -1,12 +1,161 @@
 import abc
 
-from math import sqrt, atanh
-from typing import Optional, Dict
+from math import sqrt
+from typing import Callable, Dict, Optional
 
 import numpy as np
 
-from scipy.stats import norm, chi2, ncx2, ncf, nct, f as f_dist, t as t_dist
-from scipy.optimize import brentq, bisect
+from scipy.special import chdtri, chndtr, fdtri, ncfdtr, nctdtr, ndtr, ndtri, stdtrit
+from scipy.optimize import brentq
+
+
+def _normal_power(sig_level: float, shift: float, tails: int, sign: int) -> float:
+    """Power of a z-test whose statistic is shifted by `shift` standard errors under the alternative
+
+    Parameters
+    ----------
+    sig_level: float
+        Significance level of the test
+    shift: float
+        The effect size scaled by the square root of the (effective) sample size
+    tails: int
+        2 for a two-sided test, 1 otherwise
+    sign: int
+        -1 when the alternative is 'less', 1 otherwise
+
+    Returns
+    -------
+    The power of the test
+    """
+    crit = ndtri(sig_level / tails)
+    power = ndtr(crit + sign * shift)
+    if tails == 2:
+        power += ndtr(crit - shift)
+    return power
+
+
+def _nct_cdf(nu: float, ncp: float, x: float) -> float:
+    # nctdtr can return nan far out in the lower tail, so below the median (roughly ncp) the cdf is taken as the
+    # complement of the upper tail, which is the cdf of -T at -x. Both forms can still return nan far enough out
+    # in either tail, where the cdf has underflowed to 0 below ncp or saturated at 1 above it
+    lower = x < ncp
+    cdf = np.where(lower, 1 - nctdtr(nu, -ncp, -x), nctdtr(nu, ncp, x))
+    cdf = np.where(np.isnan(cdf), np.where(lower, 0.0, 1.0), cdf)
+    return cdf if np.ndim(cdf) else cdf.item()
+
+
+def _t_power(sig_level: float, nu: float, ncp: float, tails: int, sign: int) -> float:
+    """Power of a t-test with `nu` degrees of freedom and noncentrality parameter `ncp` under the alternative
+
+    Parameters
+    ----------
+    sig_level: float
+        Significance level of the test
+    nu: float
+        Degrees of freedom of the t statistic
+    ncp: float
+        Noncentrality parameter of the t statistic under the alternative
+    tails: int
+        2 for a two-sided test, 1 otherwise
+    sign: int
+        -1 when the alternative is 'less', 1 otherwise
+
+    Returns
+    -------
+    The power of the test
+    """
+    # The upper tail of T is the lower tail of -T, which has noncentrality -ncp
+    crit = stdtrit(nu, sig_level / tails)
+    power = _nct_cdf(nu, -sign * ncp, crit)
+    if tails == 2:
+        power += _nct_cdf(nu, ncp, crit)
+    return power
+
+
+def _f_power(dfn: float, dfd: float, ncp: float, sig_level: float) -> float:
+    """Power of an F-test with `dfn` and `dfd` degrees of freedom and noncentrality parameter `ncp`
+
+    Parameters
+    ----------
+    dfn: float
+        Degrees of freedom of the numerator
+    dfd: float
+        Degrees of freedom of the denominator
+    ncp: float
+        Noncentrality parameter of the F statistic under the alternative
+    sig_level: float
+        Significance level of the test
+
+    Returns
+    -------
+    The power of the test
+    """
+    # ncfdtr can return nan for large noncentrality parameters, where the power has saturated at 1
+    power = 1 - ncfdtr(dfn, dfd, ncp, fdtri(dfn, dfd, 1 - sig_level))
+    power = np.where(np.isnan(power), 1.0, power)
+    return power if np.ndim(power) else power.item()
+
+
+def _r_power(r: float, n: float, sig_level: float, tails: int, sign: int) -> float:
+    """Power of a test of correlation, using the arctanh transformation
+
+    Parameters
+    ----------
+    r: float
+        The correlation under the alternative
+    n: float
+        Number of observations
+    sig_level: float
+        Significance level of the test
+    tails: int
+        2 for a two-sided test, 1 otherwise
+    sign: int
+        -1 when the alternative is 'less', 1 otherwise
+
+    Returns
+    -------
+    The power of the test
+    """
+    r = sign * r
+    ttt = -stdtrit(n - 2, sig_level / tails)
+    rc = np.sqrt(pow(ttt, 2) / (pow(ttt, 2) + n - 2))
+    zr = np.arctanh(r) + r / (2 * (n - 1))
+    zrc = np.arctanh(rc)
+    power = ndtr((zr - zrc) * np.sqrt(n - 3))
+    if tails == 2:
+        power += ndtr((-zr - zrc) * np.sqrt(n - 3))
+    return power
+
+
+def _solve_increasing(
+    f: Callable[[float], float],
+    lo: float,
+    hi: float = 1e09,
+    start: Optional[float] = None,
+) -> float:
+    """Find the root of an objective that increases with its argument, such as the sample size
+
+    Parameters
+    ----------
+    f: callable
+        The objective, negative below the root and positive above it
+    lo: float
+        The smallest admissible value
+    hi: float
+        The largest value searched
+    start: float, default=None
+        The first upper end tried for the bracket. Defaults to twice lo
+
+    Returns
+    -------
+    The value at which f crosses zero
+    """
+    # Doubling the upper end until it passes the root keeps brentq on a narrow bracket, and away from the huge
+    # noncentrality parameters near hi where the noncentral distributions lose precision
+    a, b = lo, 2 * lo if start is None else start
+    while b < hi and f(b) < 0:
+        a, b = b, 2 * b
+    return brentq(f, a, min(b, hi))
 
 
 class pwr_1n(abc.ABC):
@@ -38,6 +187,9 @@ class pwr_1n(abc.ABC):
         self.sig_level = sig_level
         self.power = power
         self.alternative = alternative.casefold()
+        # Resolved once here so the objectives never compare strings while a root finder is running
+        self._tails = 2 if self.alternative == "two-sided" else 1
+        self._sign = -1 if self.alternative == "less" else 1
         self.method = "Difference of proportion power calculation for binomial distribution (arcsine transformation)"
         self.note = "Same sample sizes"
 
@@ -57,6 +209,9 @@ class pwr_1n(abc.ABC):
     def _get_sig_level(self, sig_level) -> None:
         pass
 
+    def _solve_n(self) -> float:
+        return _solve_increasing(self._get_n, 2 + 1e-10)
+
     def pwr_test(self) -> Dict:
         if self.power is None:
             self.power = self._get_power()
@@ -68,7 +223,7 @@ class pwr_1n(abc.ABC):
             else:
                 self.effect_size = brentq(self._get_effect_size, -10, 5)
         elif self.n is None:
-            self.n = np.ceil(brentq(self._get_n, 2 + 1e-10, 1e09))
+            self.n = np.ceil(self._solve_n())
         else:
             self.sig_level = brentq(self._get_sig_level, 1e-10, 1 - 1e-10)
         if self.note is not None:
@@ -125,6 +280,9 @@ class pwr_2n(abc.ABC):
         self.sig_level = sig_level
         self.power = power
         self.alternative = alternative.casefold()
+        # Resolved once here so the objectives never compare strings while a root finder is running
+        self._tails = 2 if self.alternative == "two-sided" else 1
+        self._sign = -1 if self.alternative == "less" else 1
         self.method = "Difference of proportion power calculation for binomial distribution (arcsine transformation)"
         self.note = "Different sample sizes"
 
@@ -159,9 +317,9 @@ class pwr_2n(abc.ABC):
             else:
                 self.effect_size = brentq(self._get_effect_size, -10, 5)
         elif self.n1 is None:
-            self.n1 = np.ceil(brentq(self._get_n1, 2 + 1e-10, 1e09))
+            self.n1 = np.ceil(_solve_increasing(self._get_n1, 2 + 1e-10))
         elif self.n2 is None:
-            self.n2 = np.ceil(brentq(self._get_n2, 2 + 1e-10, 1e09))
+            self.n2 = np.ceil(_solve_increasing(self._get_n2, 2 + 1e-10))
         else:
             self.sig_level = brentq(self._get_sig_level, 1e-10, 1 - 1e-10)
         if self.note is not None:
@@ -214,75 +372,37 @@ class pwr_2p(pwr_1n):
         super().__init__(h, n, sig_level, power, alternative)
 
     def _get_power(self) -> float:
-        if self.alternative == "two-sided":
-            power = norm.sf(
-                norm.isf(self.sig_level / 2) - self.effect_size * sqrt(self.n / 2)
-            ) + norm.cdf(
-                norm.ppf(self.sig_level / 2) - self.effect_size * sqrt(self.n / 2)
-            )
-        elif self.alternative == "greater":
-            power = norm.sf(
-                norm.isf(self.sig_level) - self.effect_size * sqrt(self.n / 2)
-            )
-        else:
-            power = norm.cdf(
-                norm.ppf(self.sig_level) - self.effect_size * sqrt(self.n / 2)
-            )
-        return power
+        shift = self.effect_size * np.sqrt(self.n / 2)
+        return _normal_power(self.sig_level, shift, self._tails, self._sign)
 
     def _get_effect_size(self, h: float) -> float:
-        if self.alternative == "two-sided":
-            h = (
-                norm.sf(norm.isf(self.sig_level / 2) - h * sqrt(self.n / 2))
-                + norm.cdf(norm.ppf(self.sig_level / 2) - h * sqrt(self.n / 2))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            h = norm.sf(norm.isf(self.sig_level) - h * sqrt(self.n / 2)) - self.power
-        else:
-            h = norm.cdf(norm.ppf(self.sig_level) - h * sqrt(self.n / 2)) - self.power
-        return h
+        shift = h * sqrt(self.n / 2)
+        return (
+            _normal_power(self.sig_level, shift, self._tails, self._sign) - self.power
+        )
 
     def _get_n(self, n: int) -> float:
-        if self.alternative == "two-sided":
-            n = (
-                norm.sf(norm.isf(self.sig_level / 2) - self.effect_size * sqrt(n / 2))
-                + norm.cdf(
-                    norm.ppf(self.sig_level / 2) - self.effect_size * sqrt(n / 2)
-                )
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n = (
-                norm.sf(norm.isf(self.sig_level) - self.effect_size * sqrt(n / 2))
-                - self.power
-            )
-        else:
-            n = (
-                norm.cdf(norm.ppf(self.sig_level) - self.effect_size * sqrt(n / 2))
-                - self.power
-            )
-        return n
+        shift = self.effect_size * sqrt(n / 2)
+        return (
+            _normal_power(self.sig_level, shift, self._tails, self._sign) - self.power
+        )
 
     def _get_sig_level(self, sig_level: float) -> float:
-        if self.alternative == "two-sided":
-            sig_level = (
-                norm.sf(norm.isf(sig_level / 2) - self.effect_size * sqrt(self.n / 2))
-                + norm.cdf(
-                    norm.ppf(sig_level / 2) - self.effect_size * sqrt(self.n / 2)
-                )
-                - self.power
-            )
-        elif self.alternative == "greater":
-            sig_level = (
-                norm.sf(norm.isf(sig_level) - self.effect_size * sqrt(self.n / 2))
-                - self.power
-            )
-        else:
-            sig_level = (
-                norm.cdf(norm.ppf(sig_level) - self.h * sqrt(self.n / 2)) - self.power
+        shift = self.effect_size * sqrt(self.n / 2)
+        return _normal_power(sig_level, shift, self._tails, self._sign) - self.power
+
+    def _solve_n(self) -> float:
+        # One-sided power is a single normal tail, so n can be solved for directly
+        if self._tails == 1 and self.effect_size != 0:
+            root_n = (
+                self._sign
+                * (ndtri(self.power) - ndtri(self.sig_level))
+                / self.effect_size
             )
-        return sig_level
+            n = 2 * pow(root_n, 2)
+            if root_n > 0 and 2 < n <= 1e09:
+                return n
+        return super()._solve_n()
 
 
 class pwr_2p2n(pwr_2n):
@@ -315,149 +435,30 @@ class pwr_2p2n(pwr_2n):
         super().__init__(h, n1, n2, sig_level, power, alternative)
 
     def _get_power(self) -> float:
-        if self.alternative == "two-sided":
-            power = norm.sf(
-                norm.isf(self.sig_level / 2)
-                - self.effect_size * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-            ) + norm.cdf(
-                norm.ppf(self.sig_level / 2)
-                - self.effect_size * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-            )
-        elif self.alternative == "greater":
-            power = norm.sf(
-                norm.isf(self.sig_level)
-                - self.effect_size * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-            )
-        else:
-            power = norm.cdf(
-                norm.ppf(self.sig_level)
-                - self.effect_size * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-            )
-        return power
+        shift = self.effect_size * np.sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
+        return _normal_power(self.sig_level, shift, self._tails, self._sign)
 
     def _get_effect_size(self, h: float) -> float:
-        if self.alternative == "two-sided":
-            h = (
-                norm.sf(
-                    norm.isf(self.sig_level / 2)
-                    - h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                + norm.cdf(
-                    norm.ppf(self.sig_level / 2)
-                    - h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                - self.power
-            )
-        elif self.alternative == "greater":
-            h = (
-                norm.sf(
-                    norm.isf(self.sig_level)
-                    - h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                - self.power
-            )
-        else:
-            h = (
-                norm.cdf(
-                    norm.ppf(self.sig_level)
-                    - h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                - self.power
-            )
-        return h
+        shift = h * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
+        return (
+            _normal_power(self.sig_level, shift, self._tails, self._sign) - self.power
+        )
 
     def _get_n1(self, n1: int) -> float:
-        if self.alternative == "two-sided":
-            n1 = (
-                norm.sf(
-                    norm.isf(self.sig_level / 2)
-                    - self.effect_size * sqrt(n1 * self.n2 / (n1 + self.n2))
-                )
-                + norm.cdf(
-                    norm.ppf(self.sig_level / 2)
-                    - self.effect_size * sqrt(n1 * self.n2 / (n1 + self.n2))
-                )
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n1 = (
-                norm.sf(
-                    norm.isf(self.sig_level)
-                    - self.effect_size * sqrt(n1 * self.n2 / (n1 + self.n2))
-                )
-                - self.power
-            )
-        else:
-            n1 = (
-                norm.cdf(
-                    norm.ppf(self.sig_level)
-                    - self.effect_size * sqrt(n1 * self.n2 / (n1 + self.n2))
-                )
-                - self.power
-            )
-        return n1
+        shift = self.effect_size * sqrt(n1 * self.n2 / (n1 + self.n2))
+        return (
+            _normal_power(self.sig_level, shift, self._tails, self._sign) - self.power
+        )
 
     def _get_n2(self, n2: int) -> float:
-        if self.alternative == "two-sided":
-            n2 = (
-                norm.sf(
-                    norm.isf(self.sig_level / 2)
-                    - self.effect_size * sqrt(self.n1 * n2 / (self.n1 + n2))
-                )
-                + norm.cdf(
-                    norm.ppf(self.sig_level / 2)
-                    - self.effect_size * sqrt(self.n1 * n2 / (self.n1 + n2))
-                )
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n2 = (
-                norm.sf(
-                    norm.isf(self.sig_level)
-                    - self.effect_size * sqrt(self.n1 * n2 / (self.n1 + n2))
-                )
-                - self.power
-            )
-        else:
-            n2 = (
-                norm.cdf(
-                    norm.ppf(self.sig_level)
-                    - self.effect_size * sqrt(self.n1 * n2 / (self.n1 + n2))
-                )
-                - self.power
-            )
-        return n2
+        shift = self.effect_size * sqrt(self.n1 * n2 / (self.n1 + n2))
+        return (
+            _normal_power(self.sig_level, shift, self._tails, self._sign) - self.power
+        )
 
     def _get_sig_level(self, sig_level: float) -> float:
-        if self.alternative == "two-sided":
-            sig_level = (
-                norm.sf(
-                    norm.isf(sig_level / 2)
-                    - self.effect_size * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                + norm.cdf(
-                    norm.ppf(sig_level / 2)
-                    - self.effect_size * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                - self.power
-            )
-        elif self.alternative == "greater":
-            sig_level = (
-                norm.sf(
-                    norm.isf(sig_level)
-                    - self.effect_size * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                - self.power
-            )
-        else:
-            sig_level = (
-                norm.cdf(
-                    norm.ppf(sig_level)
-                    - self.effect_size * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
-                )
-                - self.power
-            )
-        return sig_level
+        shift = self.effect_size * sqrt(self.n1 * self.n2 / (self.n1 + self.n2))
+        return _normal_power(sig_level, shift, self._tails, self._sign) - self.power
 
 
 class pwr_anova:
@@ -494,63 +495,28 @@ class pwr_anova:
 
     def _get_power(self) -> float:
         l = self.k * self.n * pow(self.f, 2)
-        power = ncf.sf(
-            f_dist.isf(self.sig_level, self.k - 1, (self.n - 1) * self.k),
-            self.k - 1,
-            (self.n - 1) * self.k,
-            l,
-        )
+        power = _f_power(self.k - 1, (self.n - 1) * self.k, l, self.sig_level)
         return power
 
     def _get_k(self, k: int) -> float:
         l = k * self.n * pow(self.f, 2)
-        k = (
-            ncf.sf(
-                f_dist.isf(self.sig_level, k - 1, (self.n - 1) * k),
-                k - 1,
-                (self.n - 1) * k,
-                l,
-            )
-            - self.power
-        )
+        k = _f_power(k - 1, (self.n - 1) * k, l, self.sig_level) - self.power
         return k
 
     def _get_n(self, n: int) -> float:
         l = self.k * n * pow(self.f, 2)
-        n = (
-            ncf.sf(
-                f_dist.isf(self.sig_level, self.k - 1, (n - 1) * self.k),
-                self.k - 1,
-                (n - 1) * self.k,
-                l,
-            )
-            - self.power
-        )
+        n = _f_power(self.k - 1, (n - 1) * self.k, l, self.sig_level) - self.power
         return n
 
     def _get_effect_size(self, f: float) -> float:
         l = self.k * self.n * pow(f, 2)
-        f = (
-            ncf.sf(
-                f_dist.isf(self.sig_level, self.k - 1, (self.n - 1) * self.k),
-                self.k - 1,
-                (self.n - 1) * self.k,
-                l,
-            )
-            - self.power
-        )
+        f = _f_power(self.k - 1, (self.n - 1) * self.k, l, self.sig_level) - self.power
         return f
 
     def _get_sig_level(self, sig_level: float) -> float:
         l = self.k * self.n * pow(self.f, 2)
         sig_level = (
-            ncf.sf(
-                f_dist.isf(sig_level, self.k - 1, (self.n - 1) * self.k),
-                self.k - 1,
-                (self.n - 1) * self.k,
-                l,
-            )
-            - self.power
+            _f_power(self.k - 1, (self.n - 1) * self.k, l, sig_level) - self.power
         )
         return sig_level
 
@@ -560,9 +526,9 @@ class pwr_anova:
         elif self.k is None:
             self.k = np.ceil(brentq(self._get_k, 2 + 1e-10, 100))
         elif self.n is None:
-            self.n = np.ceil(brentq(self._get_n, 2 + 1e-10, 1e09))
+            self.n = np.ceil(_solve_increasing(self._get_n, 2 + 1e-10))
         elif self.f is None:
-            self.f = bisect(self._get_effect_size, 1e-07, 1e07)
+            self.f = _solve_increasing(self._get_effect_size, 1e-07, 1e07, start=1)
         else:
             self.sig_level = brentq(self._get_sig_level, 1e-10, 1 - 1e-10)
         return {
@@ -609,32 +575,32 @@ class pwr_chisq:
         self.note = "N is the number of observations"
 
     def _get_power(self) -> float:
-        k = chi2.isf(self.sig_level, self.df)
-        power = ncx2.sf(k, self.df, self.n * pow(self.w, 2))
+        k = chdtri(self.df, self.sig_level)
+        power = 1 - chndtr(k, self.df, self.n * pow(self.w, 2))
         return power
 
     def _get_effect_size(self, w: float) -> float:
-        k = chi2.isf(self.sig_level, self.df)
-        w = ncx2.sf(k, self.df, self.n * pow(w, 2)) - self.power
+        k = chdtri(self.df, self.sig_level)
+        w = 1 - chndtr(k, self.df, self.n * pow(w, 2)) - self.power
         return w
 
     def _get_n(self, n: int) -> float:
-        k = chi2.isf(self.sig_level, self.df)
-        n = ncx2.sf(k, self.df, n * pow(self.w, 2)) - self.power
+        k = chdtri(self.df, self.sig_level)
+        n = 1 - chndtr(k, self.df, n * pow(self.w, 2)) - self.power
         return n
 
     def _get_sig_level(self, sig_level: float) -> float:
-        k = chi2.isf(sig_level, self.df)
-        sig_level = ncx2.sf(k, self.df, self.n * pow(self.w, 2)) - self.power
+        k = chdtri(self.df, sig_level)
+        sig_level = 1 - chndtr(k, self.df, self.n * pow(self.w, 2)) - self.power
         return sig_level
 
     def pwr_test(self) -> Dict:
         if self.power is None:
             self.power = self._get_power()
         elif self.w is None:
-            self.w = brentq(self._get_effect_size, 1e-10, 1e09)
+            self.w = _solve_increasing(self._get_effect_size, 1e-10, start=1)
         elif self.n is None:
-            self.n = np.ceil(brentq(self._get_n, 1 + 1e-10, 1e09))
+            self.n = np.ceil(_solve_increasing(self._get_n, 1 + 1e-10))
         else:
             self.sig_level = brentq(self._get_sig_level, 1e-10, 1 - 1e-10)
         return {
@@ -681,33 +647,27 @@ class pwr_f2:
 
     def _get_power(self) -> float:
         l = self.f2 * (self.u + self.v + 1)
-        power = ncf.sf(f_dist.isf(self.sig_level, self.u, self.v), self.u, self.v, l)
+        power = _f_power(self.u, self.v, l, self.sig_level)
         return power
 
     def _get_u(self, u: int) -> float:
         l = self.f2 * (u + self.v + 1)
-        u = ncf.sf(f_dist.isf(self.sig_level, u, self.v), u, self.v, l) - self.power
+        u = _f_power(u, self.v, l, self.sig_level) - self.power
         return u
 
     def _get_v(self, v: int) -> float:
         l = self.f2 * (self.u + v + 1)
-        v = ncf.sf(f_dist.isf(self.sig_level, self.u, v), self.u, v, l) - self.power
+        v = _f_power(self.u, v, l, self.sig_level) - self.power
         return v
 
     def _get_effect_size(self, f2: float) -> float:
         l = f2 * (self.u + self.v + 1)
-        f2 = (
-            ncf.sf(f_dist.isf(self.sig_level, self.u, self.v), self.u, self.v, l)
-            - self.power
-        )
+        f2 = _f_power(self.u, self.v, l, self.sig_level) - self.power
         return f2
 
     def _get_sig_level(self, sig_level: float) -> float:
         l = self.f2 * (self.u + self.v + 1)
-        sig_level = (
-            ncf.sf(f_dist.isf(sig_level, self.u, self.v), self.u, self.v, l)
-            - self.power
-        )
+        sig_level = _f_power(self.u, self.v, l, sig_level) - self.power
         return sig_level
 
     def pwr_test(self) -> Dict:
@@ -716,9 +676,9 @@ class pwr_f2:
         elif self.u is None:
             self.u = np.ceil(brentq(self._get_u, 1 + 1e-10, 100))
         elif self.v is None:
-            self.v = np.ceil(brentq(self._get_v, 1 + 1e-10, 1e09))
+            self.v = np.ceil(_solve_increasing(self._get_v, 1 + 1e-10))
         elif self.f2 is None:
-            self.f2 = bisect(self._get_effect_size, 1e-07, 1e07)
+            self.f2 = _solve_increasing(self._get_effect_size, 1e-07, 1e07, start=1)
         else:
             self.sig_level = brentq(self._get_sig_level, 1e-10, 1 - 1e-10)
         return {
@@ -762,72 +722,37 @@ class pwr_norm(pwr_1n):
         self.note = None
 
     def _get_power(self) -> float:
-        if self.alternative == "two-sided":
-            power = norm.sf(
-                norm.isf(self.sig_level / 2) - self.effect_size * sqrt(self.n)
-            ) + norm.cdf(norm.ppf(self.sig_level / 2) - self.effect_size * sqrt(self.n))
-        elif self.alternative == "greater":
-            power = norm.sf(norm.isf(self.sig_level) - self.effect_size * sqrt(self.n))
-        else:
-            power = norm.cdf(norm.ppf(self.sig_level) - self.effect_size * sqrt(self.n))
-        return power
+        shift = self.effect_size * np.sqrt(self.n)
+        return _normal_power(self.sig_level, shift, self._tails, self._sign)
 
     def _get_effect_size(self, effect_size: float) -> float:
-        if self.alternative == "two-sided":
-            effect_size = (
-                norm.sf(norm.isf(self.sig_level / 2) - effect_size * sqrt(self.n))
-                + norm.cdf(norm.ppf(self.sig_level / 2) - effect_size * sqrt(self.n))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            effect_size = (
-                norm.sf(norm.isf(self.sig_level) - effect_size * sqrt(self.n))
-                - self.power
-            )
-        else:
-            effect_size = (
-                norm.cdf(norm.ppf(self.sig_level) - effect_size * sqrt(self.n))
-                - self.power
-            )
-        return effect_size
+        shift = effect_size * sqrt(self.n)
+        return (
+            _normal_power(self.sig_level, shift, self._tails, self._sign) - self.power
+        )
 
     def _get_n(self, n: int) -> float:
-        if self.alternative == "two-sided":
-            n = (
-                norm.sf(norm.isf(self.sig_level / 2) - self.effect_size * sqrt(n))
-                + norm.cdf(norm.ppf(self.sig_level / 2) - self.effect_size * sqrt(n))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n = (
-                norm.sf(norm.isf(self.sig_level) - self.effect_size * sqrt(n))
-                - self.power
-            )
-        else:
-            n = (
-                norm.cdf(norm.ppf(self.sig_level) - self.effect_size * sqrt(n))
-                - self.power
-            )
-        return n
+        shift = self.effect_size * sqrt(n)
+        return (
+            _normal_power(self.sig_level, shift, self._tails, self._sign) - self.power
+        )
 
     def _get_sig_level(self, sig_level: float) -> float:
-        if self.alternative == "two-sided":
-            sig_level = (
-                norm.sf(norm.isf(sig_level / 2) - self.effect_size * sqrt(self.n))
-                + norm.cdf(norm.ppf(sig_level / 2) - self.effect_size * sqrt(self.n))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            sig_level = (
-                norm.sf(norm.isf(sig_level) - self.effect_size * sqrt(self.n))
-                - self.power
-            )
-        else:
-            sig_level = (
-                norm.cdf(norm.ppf(sig_level) - self.effect_size * sqrt(self.n))
-                - self.power
+        shift = self.effect_size * sqrt(self.n)
+        return _normal_power(sig_level, shift, self._tails, self._sign) - self.power
+
+    def _solve_n(self) -> float:
+        # One-sided power is a single normal tail, so n can be solved for directly
+        if self._tails == 1 and self.effect_size != 0:
+            root_n = (
+                self._sign
+                * (ndtri(self.power) - ndtri(self.sig_level))
+                / self.effect_size
             )
-        return sig_level
+            n = pow(root_n, 2)
+            if root_n > 0 and 2 < n <= 1e09:
+                return n
+        return super()._solve_n()
 
 
 class pwr_p(pwr_norm):
@@ -890,85 +815,27 @@ class pwr_r(pwr_1n):
         self.note = None
 
     def _get_power(self) -> float:
-        if self.alternative == "less":
-            self.effect_size *= -1
-        if self.alternative == "two-sided":
-            sig_level = self.sig_level / 2
-        else:
-            sig_level = self.sig_level
-        ttt = t_dist.isf(sig_level, df=self.n - 2)
-        rc = sqrt(pow(ttt, 2) / (pow(ttt, 2) + self.n - 2))
-        print(self.effect_size)
-        zr = atanh(self.effect_size) + self.effect_size / (2 * (self.n - 1))
-        zrc = atanh(rc)
-        if self.alternative == "two-sided":
-            power = norm.cdf((zr - zrc) * sqrt(self.n - 3)) + norm.cdf(
-                (-zr - zrc) * sqrt(self.n - 3)
-            )
-        else:
-            power = norm.cdf((zr - zrc) * sqrt(self.n - 3))
-        return power
+        return _r_power(
+            self.effect_size, self.n, self.sig_level, self._tails, self._sign
+        )
 
     def _get_effect_size(self, effect_size: float) -> float:
-        if self.alternative == "less":
-            effect_size *= -1
-        if self.alternative == "two-sided":
-            sig_level = self.sig_level / 2
-        else:
-            sig_level = self.sig_level
-        ttt = t_dist.isf(sig_level, df=self.n - 2)
-        zr = atanh(effect_size) + effect_size / (2 * (self.n - 1))
-        rc = sqrt(pow(ttt, 2) / (pow(ttt, 2) + self.n - 2))
-        zrc = atanh(rc)
-        if self.alternative == "two-sided":
-            effect_size = (
-                norm.cdf((zr - zrc) * sqrt(self.n - 3))
-                + norm.cdf((-zr - zrc) * sqrt(self.n - 3))
-                - self.power
-            )
-        else:
-            effect_size = norm.cdf((zr - zrc) * sqrt(self.n - 3)) - self.power
-        return effect_size
+        return (
+            _r_power(effect_size, self.n, self.sig_level, self._tails, self._sign)
+            - self.power
+        )
 
     def _get_n(self, n: int) -> float:
-        if self.alternative == "less":
-            self.effect_size *= -1
-        if self.alternative == "two-sided":
-            sig_level = self.sig_level / 2
-        else:
-            sig_level = self.sig_level
-        ttt = t_dist.isf(sig_level, df=n - 2)
-        zr = atanh(self.effect_size) + self.effect_size / (2 * (n - 1))
-        rc = sqrt(pow(ttt, 2) / (pow(ttt, 2) + n - 2))
-        zrc = atanh(rc)
-        if self.alternative == "two-sided":
-            n = (
-                norm.cdf((zr - zrc) * sqrt(n - 3))
-                + norm.cdf((-zr - zrc) * sqrt(n - 3))
-                - self.power
-            )
-        else:
-            n = norm.cdf((zr - zrc) * sqrt(n - 3)) - self.power
-        return n
+        return (
+            _r_power(self.effect_size, n, self.sig_level, self._tails, self._sign)
+            - self.power
+        )
 
     def _get_sig_level(self, sig_level: float) -> float:
-        if self.alternative == "less":
-            self.effect_size *= -1
-        if self.alternative == "two-sided":
-            sig_level /= 2
-        ttt = t_dist.isf(sig_level, df=self.n - 2)
-        zr = atanh(self.effect_size) + self.effect_size / (2 * (self.n - 1))
-        rc = sqrt(pow(ttt, 2) / (pow(ttt, 2) + self.n - 2))
-        zrc = atanh(rc)
-        if self.alternative == "two-sided":
-            sig_level = (
-                norm.cdf((zr - zrc) * sqrt(self.n - 3))
-                + norm.cdf((-zr - zrc) * sqrt(self.n - 3))
-                - self.power
-            )
-        else:
-            sig_level = norm.cdf((zr - zrc) * sqrt(self.n - 3)) - self.power
-        return sig_level
+        return (
+            _r_power(self.effect_size, self.n, sig_level, self._tails, self._sign)
+            - self.power
+        )
 
     def pwr_test(self) -> Dict:
         if self.power is None:
@@ -979,7 +846,7 @@ class pwr_r(pwr_1n):
             else:
                 self.effect_size = brentq(self._get_effect_size, -1 + 1e-10, 1 - 1e-10)
         elif self.n is None:
-            self.n = np.ceil(brentq(self._get_n, 4 + 1e-10, 1e09))
+            self.n = np.ceil(_solve_increasing(self._get_n, 4 + 1e-10))
         else:
             self.sig_level = brentq(self._get_sig_level, 1e-10, 1 - 1e-10)
         return {
@@ -988,7 +855,7 @@ class pwr_r(pwr_1n):
             "sig_level": self.sig_level,
             "power": self.power,
             "alternative": self.alternative,
-            "method": self.method,
+            "method": self.method
         }
 
 
@@ -1025,6 +892,9 @@ class pwr_t:
         self.power = power
         self.type = type.casefold()
         self.alternative = alternative.casefold()
+        # Resolved once here so the objectives never compare strings while a root finder is running
+        self._tails = 2 if self.alternative == "two-sided" else 1
+        self._sign = -1 if self.alternative == "less" else 1
         if self.type == "one-sample":
             self.method = "One Sample"
             self.note = None
@@ -1040,103 +910,23 @@ class pwr_t:
 
     def _get_power(self) -> float:
         nu = (self.n - 1) * self.t_sample
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.sig_level / 2, nu)
-            power = nct.sf(qu, nu, sqrt(self.n / self.t_sample) * self.d) + nct.cdf(
-                -qu, nu, sqrt(self.n / self.t_sample) * self.d
-            )
-        elif self.alternative == "greater":
-            power = nct.sf(
-                t_dist.isf(self.sig_level, nu),
-                nu,
-                sqrt(self.n / self.t_sample) * self.d,
-            )
-        else:
-            power = nct.cdf(
-                t_dist.ppf(self.sig_level, nu),
-                nu,
-                sqrt(self.n / self.t_sample) * self.d,
-            )
-        return power
+        ncp = np.sqrt(self.n / self.t_sample) * self.d
+        return _t_power(self.sig_level, nu, ncp, self._tails, self._sign)
 
     def _get_effect_size(self, effect_size: float) -> float:
         nu = (self.n - 1) * self.t_sample
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.sig_level / 2, nu)
-            effect_size = (
-                nct.sf(qu, nu, sqrt(self.n / self.t_sample) * effect_size)
-                + nct.cdf(-qu, nu, sqrt(self.n / self.t_sample) * effect_size)
-                - self.power
-            )
-        elif self.alternative == "greater":
-            effect_size = (
-                nct.sf(
-                    t_dist.isf(self.sig_level, nu),
-                    nu,
-                    sqrt(self.n / self.t_sample) * effect_size,
-                )
-                - self.power
-            )
-        else:
-            effect_size = (
-                nct.cdf(
-                    t_dist.ppf(self.sig_level, nu),
-                    nu,
-                    sqrt(self.n / self.t_sample) * effect_size,
-                )
-                - self.power
-            )
-        return effect_size
+        ncp = sqrt(self.n / self.t_sample) * effect_size
+        return _t_power(self.sig_level, nu, ncp, self._tails, self._sign) - self.power
 
     def _get_n(self, n: int) -> float:
         nu = (n - 1) * self.t_sample
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.sig_level / 2, nu)
-            n = (
-                nct.sf(qu, nu, sqrt(n / self.t_sample) * self.d)
-                + nct.cdf(-qu, nu, sqrt(n / self.t_sample) * self.d)
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n = (
-                nct.sf(
-                    t_dist.isf(self.sig_level, nu), nu, sqrt(n / self.t_sample) * self.d
-                )
-                - self.power
-            )
-        else:
-            n = (
-                nct.cdf(
-                    t_dist.ppf(self.sig_level, nu), nu, sqrt(n / self.t_sample) * self.d
-                )
-                - self.power
-            )
-        return n
+        ncp = sqrt(n / self.t_sample) * self.d
+        return _t_power(self.sig_level, nu, ncp, self._tails, self._sign) - self.power
 
     def _get_sig_level(self, sig_level: float) -> float:
         nu = (self.n - 1) * self.t_sample
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(sig_level / 2, nu)
-            sig_level = (
-                nct.sf(qu, nu, sqrt(self.n / self.t_sample) * self.d)
-                + nct.cdf(-qu, nu, sqrt(self.n / self.t_sample) * self.d)
-                - self.power
-            )
-        elif self.alternative == "greater":
-            sig_level = (
-                nct.sf(
-                    t_dist.isf(sig_level, nu), nu, sqrt(self.n / self.t_sample) * self.d
-                )
-                - self.power
-            )
-        else:
-            sig_level = (
-                nct.cdf(
-                    t_dist.ppf(sig_level, nu), nu, sqrt(self.n / self.t_sample) * self.d
-                )
-                - self.power
-            )
-        return sig_level
+        ncp = sqrt(self.n / self.t_sample) * self.d
+        return _t_power(sig_level, nu, ncp, self._tails, self._sign) - self.power
 
     def pwr_test(self) -> Dict:
         if self.power is None:
@@ -1149,7 +939,7 @@ class pwr_t:
             else:
                 self.d = brentq(self._get_effect_size, -10, 5)
         elif self.n is None:
-            self.n = np.ceil(brentq(self._get_n, 2 + 1e-10, 1e09))
+            self.n = np.ceil(_solve_increasing(self._get_n, 2 + 1e-10))
         else:
             self.sig_level = brentq(self._get_sig_level, 1e-10, 1 - 1e-10)
         if self.note is not None:
@@ -1169,7 +959,7 @@ class pwr_t:
                 "sig_level": self.sig_level,
                 "power": self.power,
                 "alternative": self.alternative,
-                "method": "{} t test power calculation".format(self.method)
+                "method": "{} t test power calculation".format(self.method),
             }
 
 
@@ -1205,141 +995,25 @@ class pwr_t2n(pwr_2n):
 
     def _get_power(self) -> float:
         nu = self.n1 + self.n2 - 2
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.sig_level / 2, nu)
-            power = nct.sf(
-                qu, nu, self.effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2))
-            ) + nct.cdf(
-                -qu, nu, self.effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2))
-            )
-        elif self.alternative == "greater":
-            power = nct.sf(
-                t_dist.isf(self.sig_level, nu),
-                nu,
-                self.effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2)),
-            )
-        else:
-            power = nct.cdf(
-                t_dist.ppf(self.sig_level, nu),
-                nu,
-                self.effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2)),
-            )
-        return power
+        ncp = self.effect_size / np.sqrt(1 / self.n1 + 1 / self.n2)
+        return _t_power(self.sig_level, nu, ncp, self._tails, self._sign)
 
     def _get_effect_size(self, effect_size: float) -> float:
         nu = self.n1 + self.n2 - 2
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.sig_level / 2, nu)
-            effect_size = (
-                nct.sf(qu, nu, effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2)))
-                + nct.cdf(-qu, nu, effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2)))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            effect_size = (
-                nct.sf(
-                    t_dist.isf(self.sig_level, nu),
-                    nu,
-                    effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2)),
-                )
-                - self.power
-            )
-        else:
-            effect_size = (
-                nct.cdf(
-                    t_dist.ppf(self.sig_level, nu),
-                    nu,
-                    effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2)),
-                )
-                - self.power
-            )
-        return effect_size
+        ncp = effect_size / sqrt(1 / self.n1 + 1 / self.n2)
+        return _t_power(self.sig_level, nu, ncp, self._tails, self._sign) - self.power
 
     def _get_n1(self, n1: int) -> float:
         nu = n1 + self.n2 - 2
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.sig_level / 2, nu)
-            n1 = (
-                nct.sf(qu, nu, self.effect_size * (1 / sqrt(1 / n1 + 1 / self.n2)))
-                + nct.cdf(-qu, nu, self.effect_size * (1 / sqrt(1 / n1 + 1 / self.n2)))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n1 = (
-                nct.sf(
-                    t_dist.isf(self.sig_level, nu),
-                    nu,
-                    self.effect_size * (1 / sqrt(1 / n1 + 1 / self.n2)),
-                )
-                - self.power
-            )
-        else:
-            n1 = (
-                nct.cdf(
-                    t_dist.ppf(self.sig_level, nu),
-                    nu,
-                    self.effect_size * (1 / sqrt(1 / n1 + 1 / self.n2)),
-                )
-                - self.power
-            )
-        return n1
+        ncp = self.effect_size / sqrt(1 / n1 + 1 / self.n2)
+        return _t_power(self.sig_level, nu, ncp, self._tails, self._sign) - self.power
 
     def _get_n2(self, n2: int) -> float:
         nu = self.n1 + n2 - 2
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(self.sig_level / 2, nu)
-            n2 = (
-                nct.sf(qu, nu, self.effect_size * (1 / sqrt(1 / self.n1 + 1 / n2)))
-                + nct.cdf(-qu, nu, self.effect_size * (1 / sqrt(1 / self.n1 + 1 / n2)))
-                - self.power
-            )
-        elif self.alternative == "greater":
-            n2 = (
-                nct.sf(
-                    t_dist.isf(self.sig_level, nu),
-                    nu,
-                    self.effect_size * (1 / sqrt(1 / self.n1 + 1 / n2)),
-                )
-                - self.power
-            )
-        else:
-            n2 = (
-                nct.cdf(
-                    t_dist.ppf(self.sig_level, nu),
-                    nu,
-                    self.effect_size * (1 / sqrt(1 / self.n1 + 1 / n2)),
-                )
-                - self.power
-            )
-        return n2
+        ncp = self.effect_size / sqrt(1 / self.n1 + 1 / n2)
+        return _t_power(self.sig_level, nu, ncp, self._tails, self._sign) - self.power
 
     def _get_sig_level(self, sig_level: float) -> float:
         nu = self.n1 + self.n2 - 2
-        if self.alternative == "two-sided":
-            qu = t_dist.isf(sig_level / 2, nu)
-            sig_level = (
-                nct.sf(qu, nu, self.effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2)))
-                + nct.cdf(
-                    -qu, nu, self.effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2))
-                )
-                - self.power
-            )
-        elif self.alternative == "greater":
-            sig_level = (
-                nct.sf(
-                    t_dist.isf(sig_level, nu),
-                    nu,
-                    self.effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2)),
-                )
-                - self.power
-            )
-        else:
-            sig_level = (
-                nct.cdf(
-                    t_dist.ppf(sig_level, nu),
-                    nu,
-                    self.effect_size * (1 / sqrt(1 / self.n1 + 1 / self.n2)),
-                )
-                - self.power
-            )
-        return sig_level
+        ncp = self.effect_size / sqrt(1 / self.n1 + 1 / self.n2)
+        return _t_power(sig_level, nu, ncp, self._tails, self._sign) - self.power
@@ -1,16 +1,305 @@
-from typing import Dict, Optional
-
-from src.power_classes import (
-    pwr_2p,
-    pwr_2p2n,
-    pwr_anova,
-    pwr_chisq,
-    pwr_f2,
-    pwr_norm,
-    pwr_p,
-    pwr_r,
-    pwr_t,
-    pwr_t2n,
+import os
+import sys
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Callable, Dict, Optional, TextIO, Tuple
+
+import numpy as np
+
+# The power classes pull in scipy, so each wrapper imports the class it needs when first called, and the module
+# __getattr__ below resolves them on first access for code that reaches for them through this module
+_POWER_CLASSES = frozenset(
+    (
+        "pwr_2p",
+        "pwr_2p2n",
+        "pwr_anova",
+        "pwr_chisq",
+        "pwr_f2",
+        "pwr_norm",
+        "pwr_p",
+        "pwr_r",
+        "pwr_t",
+        "pwr_t2n",
+    )
+)
+
+
+def __getattr__(name: str):
+    if name in _POWER_CLASSES:
+        from . import power_classes
+
+        value = getattr(power_classes, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Maps each accepted spelling, including R's "two.sided", onto the one string object used for it everywhere else
+_ALTERNATIVES = {
+    "two-sided": "two-sided",
+    "two.sided": "two-sided",
+    "greater": "greater",
+    "less": "less",
+}
+
+
+@lru_cache(maxsize=8)
+def _norm_alt(alternative: str) -> str:
+    canon = _ALTERNATIVES.get(alternative.casefold())
+    if canon is None:
+        raise ValueError("alternative must be one of 'two-sided', 'greater' or 'less'")
+    return canon
+
+
+# Setting the environment variable PYPWR_CACHE=0 turns the cache of solved power calculations off
+@lru_cache(maxsize=0 if os.environ.get("PYPWR_CACHE") == "0" else 4096, typed=True)
+def _cached_pwr_test(pwr_class: type, *args) -> Tuple:
+    """Solve a power calculation, reusing the result of any earlier call with the same arguments
+
+    Parameters
+    ----------
+    pwr_class: type
+        One of the classes from power_classes
+    args
+        The positional arguments used to construct pwr_class
+
+    Returns
+    -------
+    The items of the dict returned by pwr_test, as a tuple so that the cached result cannot be modified
+    """
+    return tuple(pwr_class(*args).pwr_test().items())
+
+
+def clear_pwr_caches() -> None:
+    """Release the memory held by the cache of solved power calculations"""
+    _cached_pwr_test.cache_clear()
+
+
+def _validate_mask(mask: int, names: Tuple[str, ...]) -> None:
+    """Check that exactly one of the parameters was left as None
+
+    Parameters
+    ----------
+    mask: int
+        Bitmask of the parameters that are None, with bit i set when names[i] is None
+    names: tuple of str
+        The names of the parameters, in bit order
+    """
+    if mask == 0 or mask & (mask - 1):
+        listed = ", ".join(names[:-1]) + " or " + names[-1]
+        if mask == 0:
+            raise ValueError(f"One of {listed} must be None")
+        raise ValueError(f"Only one of {listed} may be None")
+
+
+# The checks below accept NumPy arrays as well as scalars, and fail if any element is out of bounds, so that the
+# wrappers can validate array arguments before broadcasting them
+
+
+def _any(condition) -> bool:
+    return condition.any() if isinstance(condition, np.ndarray) else condition
+
+
+def _range_check(
+    name: str, value: Optional[float], lo: float = 0, hi: float = 1
+) -> None:
+    if value is None:
+        return
+    if isinstance(value, np.ndarray):
+        # Written so that nan elements fail the check, as they do for scalars
+        in_range = ((lo <= value) & (value <= hi)).all()
+    else:
+        in_range = lo <= value <= hi
+    if not in_range:
+        raise ValueError(f"{name} must be between {lo} and {hi}")
+
+
+def _positive_check(name: str, value: Optional[float]) -> None:
+    if value is not None and _any(value < 0):
+        raise ValueError(f"{name} must be positive")
+
+
+def _min_check(value: Optional[float], lo: float, message: str) -> None:
+    if value is not None and _any(value < lo):
+        raise ValueError(message)
+
+
+def _prob_check(sig_level: Optional[float], power: Optional[float]) -> None:
+    _range_check("sig_level", sig_level)
+    _range_check("power", power)
+
+
+def _pretty(print_pretty: Optional[bool], file: Optional[TextIO]) -> bool:
+    if print_pretty is None:
+        # Write-only streams, and a missing sys.stdout, are treated as not being a terminal
+        isatty = getattr(file or sys.stdout, "isatty", None)
+        return isatty is not None and isatty()
+    return print_pretty
+
+
+def _is_array(*values) -> bool:
+    return any(isinstance(v, np.ndarray) for v in values)
+
+
+def _call_pwr_test(pwr_test: Callable[..., Dict], kwargs: Dict) -> Dict:
+    return pwr_test(**kwargs, print_pretty=False)
+
+
+def _pwr_vectorized(
+    pwr_test: Callable[..., Dict], _map: Callable = map, _chunks: int = 1, **kwargs
+) -> Dict:
+    """Apply a power calculation elementwise over broadcast array arguments
+
+    Parameters
+    ----------
+    pwr_test: callable
+        One of the pwr_*_test functions
+    _map: callable, default=map
+        Used to apply pwr_test to the elements, such as the map method of an executor
+    _chunks: int, default=1
+        Number of chunks per worker, for a _map that takes a chunksize
+    kwargs: dict
+        The arguments to pwr_test. None and string arguments are passed through as is, while the remaining
+        arguments are broadcast against each other
+
+    Returns
+    -------
+    A dict laid out like the output of pwr_test, with every numeric entry replaced by an array
+    """
+    names = [k for k, v in kwargs.items() if v is not None and not isinstance(v, str)]
+    arrays = np.broadcast_arrays(*(kwargs[k] for k in names))
+    if arrays[0].size == 0:
+        raise ValueError("Array arguments must not be empty")
+    if kwargs.get("power", 0) is None and pwr_test.__name__ in _POWER_BATCH:
+        return _pwr_power_batch(pwr_test, kwargs, dict(zip(names, arrays)))
+    # Any other unknown is found with brentq, which only solves scalar problems and needs its own bracket for each
+    # element, so those are deliberately solved one element at a time through the scalar wrapper
+    shape = arrays[0].shape
+    elements = [
+        {**kwargs, **{k: a[idx].item() for k, a in zip(names, arrays)}}
+        for idx in np.ndindex(shape)
+    ]
+    if _map is map:
+        results = list(map(_call_pwr_test, repeat(pwr_test), elements))
+    else:
+        chunksize = max(1, len(elements) // _chunks)
+        results = list(
+            _map(_call_pwr_test, repeat(pwr_test), elements, chunksize=chunksize)
+        )
+    return {
+        key: (
+            value
+            if isinstance(value, str)
+            else np.reshape([r[key] for r in results], shape)
+        )
+        for key, value in results[0].items()
+    }
+
+
+def pwr_map(
+    pwr_test: Callable[..., Dict], workers: Optional[int] = None, **kwargs
+) -> Dict:
+    """Apply a power calculation over array arguments, spreading the elements over worker processes
+
+    Parameters
+    ----------
+    pwr_test: callable
+        One of the pwr_*_test functions
+    workers: int, default=None
+        Number of worker processes. If None, one per CPU
+    kwargs: dict
+        The arguments to pwr_test, which are broadcast against each other as when pwr_test is called with arrays.
+        print_pretty and file are ignored, as the results are not printed
+
+    Returns
+    -------
+    The same dict of arrays as pwr_test returns for array arguments
+    """
+    # As when a wrapper is called with arrays, the results are returned rather than pretty-printed
+    kwargs.pop("print_pretty", None)
+    kwargs.pop("file", None)
+    # Solving for power is already a single vectorised call, so only the root-finding cases are farmed out
+    if kwargs.get("power", 0) is None and pwr_test.__name__ in _POWER_BATCH:
+        return pwr_test(
+            **{
+                k: v if v is None or isinstance(v, str) else np.asarray(v)
+                for k, v in kwargs.items()
+            }
+        )
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as executor:
+        return _pwr_vectorized(
+            pwr_test, _map=executor.map, _chunks=4 * workers, **kwargs
+        )
+
+
+# The power class, its constructor arguments and the effect size made non-negative for two-sided tests, for every
+# wrapper whose power has a closed form that broadcasts over arrays
+_POWER_BATCH = {
+    "pwr_2p_test": ("pwr_2p", ("h", "n", "sig_level", "power", "alternative"), "h"),
+    "pwr_2p2n_test": (
+        "pwr_2p2n",
+        ("h", "n1", "n2", "sig_level", "power", "alternative"),
+        "h",
+    ),
+    "pwr_anova_test": ("pwr_anova", ("k", "n", "f", "sig_level", "power"), None),
+    "pwr_chisq_test": ("pwr_chisq", ("w", "n", "df", "sig_level", "power"), None),
+    "pwr_f2_test": ("pwr_f2", ("u", "v", "f2", "sig_level", "power"), None),
+    "pwr_norm_test": ("pwr_norm", ("d", "n", "sig_level", "power", "alternative"), "d"),
+    "pwr_p_test": ("pwr_p", ("h", "n", "sig_level", "power", "alternative"), "h"),
+    "pwr_r_test": ("pwr_r", ("r", "n", "sig_level", "power", "alternative"), "r"),
+    "pwr_t_test": (
+        "pwr_t",
+        ("n", "d", "sig_level", "power", "test_type", "alternative"),
+        "d",
+    ),
+    "pwr_t2n_test": (
+        "pwr_t2n",
+        ("d", "n1", "n2", "sig_level", "power", "alternative"),
+        "d",
+    ),
+}
+
+
+def _pwr_power_batch(
+    pwr_test: Callable[..., Dict], kwargs: Dict, arrays: Dict[str, np.ndarray]
+) -> Dict:
+    """Compute the power over broadcast array arguments with a single call to the power class
+
+    Parameters
+    ----------
+    pwr_test: callable
+        One of the pwr_*_test functions named in _POWER_BATCH
+    kwargs: dict
+        The arguments to pwr_test, already validated by it, with power left as None
+    arrays: dict
+        The numeric arguments of kwargs, broadcast against each other
+
+    Returns
+    -------
+    A dict laid out like the output of pwr_test, with every numeric entry replaced by an array
+    """
+    class_name, order, effect = _POWER_BATCH[pwr_test.__name__]
+    values = {**kwargs, **{k: np.array(a) for k, a in arrays.items()}}
+    if "alternative" in values:
+        values["alternative"] = _norm_alt(values["alternative"])
+        if effect is not None and values["alternative"] == "two-sided":
+            values[effect] = np.abs(values[effect])
+    from . import power_classes
+
+    return getattr(power_classes, class_name)(*(values[k] for k in order)).pwr_test()
+
+
+_PWR_2P_FMT = (
+    "\t%(method)s\n\n"
+    "\t\t  h = %(effect_size)s\n"
+    "\t\t  n = %(n)s\n"
+    "\t  sig_level = %(sig_level)s\n"
+    "\t      power = %(power)s\n"
+    "\talternative = %(alternative)s\n\n"
+    "NOTE: %(note)s\n"
 )
 
 
@@ -20,7 +309,8 @@ def pwr_2p_test(
     sig_level: Optional[float] = None,
     power: Optional[float] = None,
     alternative: str = "two-sided",
-    print_pretty: bool = True,
+    print_pretty: Optional[bool] = None,
+    file: Optional[TextIO] = None,
 ) -> Dict:
     """Compute power of test, or determine parameters to obtain target power (similar to power.prop.test).
 
@@ -36,55 +326,96 @@ def pwr_2p_test(
         Power of test (1 minus Type II error probability). Must be betwen 0 and 1
     alternative: {'two-sided', 'greater', 'less'}
         A character string specifying the alternative hypothesis
-    print_pretty: bool, default=True
-        Whether we wish to print the results in a pretty format or not
+    print_pretty: bool, default=None
+        Whether we wish to print the results in a pretty format or not. If None, the results are only
+        printed when the output is a terminal
+    file: file-like object, default=None
+        Where the pretty-printed results are written. Defaults to sys.stdout
 
     Returns
     -------
-    A dict containing our h, n, sig_level, power and alternative hypothesis
+    A dict containing our h, n, sig_level, power and alternative hypothesis.
+    If any numeric argument is an array, the arguments are broadcast against each other and every
+    numeric entry is an array of results
     """
-    if not any(v is None for v in [h, n, sig_level, power]):
-        raise ValueError("One of h, n, sig_level or power must be None")
-    if sum([v is None for v in [h, n, sig_level, power]]) > 1:
-        raise ValueError("Only one of h, n, sig_level or power may be None")
-    if sig_level is not None and (sig_level < 0 or sig_level > 1):
-        raise ValueError("sig_level must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    alternative = alternative.casefold()
-    if alternative == "two-sided" and h is not None:
-        h = abs(h)
-    pwr = pwr_2p(h, n, sig_level, power, alternative).pwr_test()
-    if print_pretty:
-        str_print = (
-            "\t"
-            + pwr["method"]
-            + "\n" * 2
-            + "\t" * 2
-            + " " * 2
-            + f"h = {pwr['effect_size']}"
-            + "\n"
-            + "\t" * 2
-            + " " * 2
-            + f"n = {pwr['n']}"
-            + "\n"
-            + "\t"
-            + " " * 2
-            + f"sig_level = {pwr['sig_level']}"
-            + "\n"
-            + "\t"
-            + " " * 6
-            + f"power = {pwr['power']}"
-            + "\n"
-            + "\t"
-            + f"alternative = {pwr['alternative']}"
-            + "\n" * 2
-            + f"NOTE: {pwr['note']}"
+    mask = (
+        (h is None) | (n is None) << 1 | (sig_level is None) << 2 | (power is None) << 3
+    )
+    _validate_mask(mask, ("h", "n", "sig_level", "power"))
+    _prob_check(sig_level, power)
+    if _is_array(h, n, sig_level, power):
+        return _pwr_vectorized(
+            pwr_2p_test,
+            h=h,
+            n=n,
+            sig_level=sig_level,
+            power=power,
+            alternative=alternative,
         )
-        print(str_print)
+    alternative = _norm_alt(alternative)
+    if alternative == "two-sided" and h is not None and h < 0:
+        h = -h
+    from .power_classes import pwr_2p
+
+    pwr = dict(_cached_pwr_test(pwr_2p, h, n, sig_level, power, alternative))
+    if _pretty(print_pretty, file):
+        (file or sys.stdout).write(_PWR_2P_FMT % pwr)
     return pwr
 
 
+def pwr_2p_grid(
+    h_arr: np.ndarray,
+    n_arr: np.ndarray,
+    sig_level: float,
+    alternative: str = "two-sided",
+) -> np.ndarray:
+    """Compute the power of pwr_2p_test for every combination of effect size and sample size
+
+    Parameters
+    ----------
+    h_arr: np.ndarray
+        The effect sizes
+    n_arr: np.ndarray
+        Number of observations (per sample)
+    sig_level: float
+        Significance level (Type I error probability). Must be between 0 and 1
+    alternative: {'two-sided', 'greater', 'less'}
+        A character string specifying the alternative hypothesis
+
+    Returns
+    -------
+    An array of shape (len(h_arr), len(n_arr)) whose [i, j] entry is the power for h_arr[i] and n_arr[j]
+    """
+    if h_arr is None or n_arr is None or sig_level is None:
+        raise ValueError("h_arr, n_arr and sig_level must all be given")
+    h_arr = np.asarray(h_arr, dtype=float)
+    n_arr = np.asarray(n_arr, dtype=float)
+    _min_check(n_arr, 1, "Number of observations must be at least 1")
+    _range_check("sig_level", sig_level)
+    alternative = _norm_alt(alternative)
+    if alternative == "two-sided":
+        h_arr = np.abs(h_arr)
+    from .power_classes import _normal_power
+
+    # The power has a closed form, so the whole grid is evaluated in one pass of scipy's ufuncs
+    shift = np.multiply.outer(h_arr, np.sqrt(n_arr / 2))
+    tails = 2 if alternative == "two-sided" else 1
+    sign = -1 if alternative == "less" else 1
+    return _normal_power(sig_level, shift, tails, sign)
+
+
+_PWR_2P2N_FMT = (
+    "\t%(method)s\n\n"
+    "\t\t  h = %(effect_size)s\n"
+    "\t\t n1 = %(n1)s\n"
+    "\t\t n2 = %(n2)s\n"
+    "\t  sig_level = %(sig_level)s\n"
+    "\t      power = %(power)s\n"
+    "\talternative = %(alternative)s\n\n"
+    "NOTE: %(note)s\n"
+)
+
+
 def pwr_2p2n_test(
     h: Optional[float] = None,
     n1: Optional[int] = None,
@@ -92,7 +423,8 @@ def pwr_2p2n_test(
     sig_level: Optional[float] = None,
     power: Optional[float] = None,
     alternative: str = "two-sided",
-    print_pretty: bool = True,
+    print_pretty: Optional[bool] = None,
+    file: Optional[TextIO] = None,
 ) -> Dict:
     """Compute power of test, or determine parameters to obtain target power.
 
@@ -110,72 +442,69 @@ def pwr_2p2n_test(
         Power of the test (1 minus Type II error probability). Must be between 0 and 1
     alternative: {'two-sided', 'greater', 'less'}
         A character string specifying the alternative hypothesis
-    print_pretty: bool, default=True
-        Whether we wish to print the results in a pretty format or not
+    print_pretty: bool, default=None
+        Whether we wish to print the results in a pretty format or not. If None, the results are only
+        printed when the output is a terminal
+    file: file-like object, default=None
+        Where the pretty-printed results are written. Defaults to sys.stdout
 
     Returns
     -------
-    A dict containing our h, n1, n2, sig_level, power and alternative hypothesis
+    A dict containing our h, n1, n2, sig_level, power and alternative hypothesis.
+    If any numeric argument is an array, the arguments are broadcast against each other and every
+    numeric entry is an array of results
     """
-    if not any(v is None for v in [h, n1, n2, sig_level, power]):
-        raise ValueError("One of h, n1, n2, sig_level or power must be None")
-    if sum([v is None for v in [h, n1, n2, sig_level, power]]) > 1:
-        raise ValueError("Only one of h, n1, n2, sig_level or power may be None")
-    if n1 is not None and n1 < 2:
-        raise ValueError("Number of observations in the first group must be at least 2")
-    if n2 is not None and n2 < 2:
-        raise ValueError(
-            "Number of observations in the second group must be at least 2"
+    mask = (
+        (h is None)
+        | (n1 is None) << 1
+        | (n2 is None) << 2
+        | (sig_level is None) << 3
+        | (power is None) << 4
+    )
+    _validate_mask(mask, ("h", "n1", "n2", "sig_level", "power"))
+    _min_check(n1, 2, "Number of observations in the first group must be at least 2")
+    _min_check(n2, 2, "Number of observations in the second group must be at least 2")
+    _prob_check(sig_level, power)
+    if _is_array(h, n1, n2, sig_level, power):
+        return _pwr_vectorized(
+            pwr_2p2n_test,
+            h=h,
+            n1=n1,
+            n2=n2,
+            sig_level=sig_level,
+            power=power,
+            alternative=alternative,
         )
-    if sig_level is not None and (sig_level < 0 or sig_level > 1):
-        raise ValueError("sig_level must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    alternative = alternative.casefold()
-    if alternative == "two-sided" and h is not None:
-        h = abs(h)
-    pwr = pwr_2p2n(h, n1, n2, sig_level, power, alternative).pwr_test()
-    if print_pretty:
-        str_print = (
-            "\t"
-            + pwr["method"]
-            + "\n" * 2
-            + "\t" * 2
-            + " " * 2
-            + f"h = {pwr['effect_size']}"
-            + "\n"
-            + "\t" * 2
-            + " "
-            + f"n1 = {pwr['n1']}"
-            + "\n"
-            + "\t" * 2
-            + " "
-            + f"n2 = {pwr['n2']}"
-            + "\n"
-            + "\t"
-            + " " * 2
-            + f"sig_level = {pwr['sig_level']}"
-            + "\n"
-            + "\t"
-            + " " * 6
-            + f"power = {pwr['power']}"
-            + "\n"
-            + "\t"
-            + f"alternative = {pwr['alternative']}"
-            + "\n" * 2
-            + f"NOTE: {pwr['note']}"
-        )
-        print(str_print)
+    alternative = _norm_alt(alternative)
+    if alternative == "two-sided" and h is not None and h < 0:
+        h = -h
+    from .power_classes import pwr_2p2n
+
+    pwr = dict(_cached_pwr_test(pwr_2p2n, h, n1, n2, sig_level, power, alternative))
+    if _pretty(print_pretty, file):
+        (file or sys.stdout).write(_PWR_2P2N_FMT % pwr)
     return pwr
 
 
+_PWR_ANOVA_FMT = (
+    "\t%(method)s\n\n"
+    "\t\t  k = %(k)s\n"
+    "\t\t  n = %(n)s\n"
+    "\t\t  f = %(effect_size)s\n"
+    "\t  sig_level = %(sig_level)s\n"
+    "\t      power = %(power)s\n\n"
+    "NOTE: %(note)s\n"
+)
+
+
 def pwr_anova_test(
     k: Optional[int] = None,
     n: Optional[int] = None,
     f: Optional[float] = None,
     sig_level: Optional[float] = None,
     power: Optional[float] = None,
-    print_pretty: bool = True,
+    print_pretty: Optional[bool] = None,
+    file: Optional[TextIO] = None,
 ) -> Dict:
     """Compute power of test or determine parameters to obtain target power (same as power.anova.test).
 
@@ -191,66 +520,66 @@ def pwr_anova_test(
         Significance level (Type I error probability). Must be between 0 and 1
     power: float, default=None
         Power of test (1 minus Type II error probability). Must be between 0 and 1
-    print_pretty: bool, default=True
-        Whether we wish to print the results in a pretty format or not
+    print_pretty: bool, default=None
+        Whether we wish to print the results in a pretty format or not. If None, the results are only
+        printed when the output is a terminal
+    file: file-like object, default=None
+        Where the pretty-printed results are written. Defaults to sys.stdout
 
     Returns
     -------
-    A dict containing our k, n, f, sig_level, and power
+    A dict containing our k, n, f, sig_level, and power.
+    If any numeric argument is an array, the arguments are broadcast against each other and every
+    numeric entry is an array of results
     """
-    if not any(v is None for v in [k, n, f, sig_level, power]):
-        raise ValueError("One of k, n, f, sig_level or power must be None")
-    if sum([v is None for v in [k, n, f, sig_level, power]]) > 1:
-        raise ValueError("Only one of k, n, f, sig_level or power may be None")
-    if f is not None and f < 0:
-        raise ValueError("f must be positive")
-    if k is not None and k < 2:
-        raise ValueError("Number of groups must be at least 2")
-    if n is not None and n < 2:
-        raise ValueError("Number of observations must be at least 2")
-    if sig_level is not None and (sig_level < 0 or sig_level > 1):
-        raise ValueError("sig_level must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    pwr = pwr_anova(k, n, f, sig_level, power).pwr_test()
-    if print_pretty:
-        str_print = (
-            "\t"
-            + pwr["method"]
-            + "\n" * 2
-            + "\t" * 2
-            + " " * 2
-            + f"k = {pwr['k']}"
-            + "\n"
-            + "\t" * 2
-            + " " * 2
-            + f"n = {pwr['n']}"
-            + "\n"
-            + "\t" * 2
-            + " " * 2
-            + f"f = {pwr['effect_size']}"
-            + "\n"
-            + "\t"
-            + " " * 2
-            + f"sig_level = {pwr['sig_level']}"
-            + "\n"
-            + "\t"
-            + " " * 6
-            + f"power = {pwr['power']}"
-            + "\n" * 2
-            + f"NOTE: {pwr['note']}"
+    mask = (
+        (k is None)
+        | (n is None) << 1
+        | (f is None) << 2
+        | (sig_level is None) << 3
+        | (power is None) << 4
+    )
+    _validate_mask(mask, ("k", "n", "f", "sig_level", "power"))
+    _positive_check("f", f)
+    _min_check(k, 2, "Number of groups must be at least 2")
+    _min_check(n, 2, "Number of observations must be at least 2")
+    _prob_check(sig_level, power)
+    if _is_array(k, n, f, sig_level, power):
+        return _pwr_vectorized(
+            pwr_anova_test,
+            k=k,
+            n=n,
+            f=f,
+            sig_level=sig_level,
+            power=power,
         )
-        print(str_print)
+    from .power_classes import pwr_anova
+
+    pwr = dict(_cached_pwr_test(pwr_anova, k, n, f, sig_level, power))
+    if _pretty(print_pretty, file):
+        (file or sys.stdout).write(_PWR_ANOVA_FMT % pwr)
     return pwr
 
 
+_PWR_CHISQ_FMT = (
+    "\t%(method)s\n\n"
+    "\t\t  w = %(effect_size)s\n"
+    "\t\t  n = %(n)s\n"
+    "\t\t df = %(df)s\n"
+    "\t  sig_level = %(sig_level)s\n"
+    "\t      power = %(power)s\n\n"
+    "NOTE: %(note)s\n"
+)
+
+
 def pwr_chisq_test(
     w: Optional[float] = None,
     n: Optional[int] = None,
     df: int = 1,
     sig_level: Optional[float] = None,
     power: Optional[float] = None,
-    print_pretty: bool = True
+    print_pretty: Optional[bool] = None,
+    file: Optional[TextIO] = None,
 ) -> Dict:
     """Compute power of test or determine parameters to obtain target power (same as power.anova.test).
 
@@ -266,64 +595,60 @@ def pwr_chisq_test(
         Significance level (Type I error probability). Must be between 0 and 1
     power: float, default=None
         Power of test (1 minus Type II error probability). Must be between 0 and 1
-    print_pretty: bool, default=True
-        Whether we wish to print the results in a pretty format or not
+    print_pretty: bool, default=None
+        Whether we wish to print the results in a pretty format or not. If None, the results are only
+        printed when the output is a terminal
+    file: file-like object, default=None
+        Where the pretty-printed results are written. Defaults to sys.stdout
 
     Returns
     -------
-    A dict containing our w, n, df, sig_level and power
+    A dict containing our w, n, df, sig_level and power.
+    If any numeric argument is an array, the arguments are broadcast against each other and every
+    numeric entry is an array of results
     """
-    if not any(v is None for v in [w, n, sig_level, power]):
-        raise ValueError("One of w, n, sig_level or power must be None")
-    if sum([v is None for v in [w, n, sig_level, power]]) > 1:
-        raise ValueError("Only one of w, n, sig_level or power may be None")
-    if w is not None and w < 0:
-        raise ValueError("w must be positive")
-    if n is not None and n < 1:
-        raise ValueError("Number of observations must be at least 1")
-    if sig_level is not None and (sig_level < 0 or sig_level > 1):
-        raise ValueError("sig_level must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    pwr = pwr_chisq(w, n, df, sig_level, power).pwr_test()
-    if print_pretty:
-        str_print = (
-            "\t"
-            + pwr["method"]
-            + "\n" * 2
-            + "\t" * 2
-            + " " * 2
-            + f"w = {pwr['effect_size']}"
-            + "\n"
-            + "\t" * 2
-            + " " * 2
-            + f"n = {pwr['n']}"
-            + "\n"
-            + "\t" * 2
-            + " "
-            + f"df = {pwr['df']}"
-            + "\n"
-            + "\t"
-            + " " * 2
-            + f"sig_level = {pwr['sig_level']}"
-            + "\n"
-            + "\t"
-            + " " * 6
-            + f"power = {pwr['power']}"
-            + "\n" * 2
-            + f"NOTE: {pwr['note']}"
+    mask = (
+        (w is None) | (n is None) << 1 | (sig_level is None) << 2 | (power is None) << 3
+    )
+    _validate_mask(mask, ("w", "n", "sig_level", "power"))
+    _positive_check("w", w)
+    _min_check(n, 1, "Number of observations must be at least 1")
+    _prob_check(sig_level, power)
+    if _is_array(w, n, df, sig_level, power):
+        return _pwr_vectorized(
+            pwr_chisq_test,
+            w=w,
+            n=n,
+            df=df,
+            sig_level=sig_level,
+            power=power,
         )
-        print(str_print)
+    from .power_classes import pwr_chisq
+
+    pwr = dict(_cached_pwr_test(pwr_chisq, w, n, df, sig_level, power))
+    if _pretty(print_pretty, file):
+        (file or sys.stdout).write(_PWR_CHISQ_FMT % pwr)
     return pwr
 
 
+_PWR_F2_FMT = (
+    "\t%(method)s\n\n"
+    "\t\t  u = %(u)s\n"
+    "\t\t  v = %(v)s\n"
+    "\t\t f2 = %(effect_size)s\n"
+    "\t  sig_level = %(sig_level)s\n"
+    "\t      power = %(power)s\n"
+)
+
+
 def pwr_f2_test(
     u: Optional[int] = None,
     v: Optional[int] = None,
     f2: Optional[float] = None,
     sig_level: Optional[float] = None,
     power: Optional[float] = None,
-    print_pretty: bool = True,
+    print_pretty: Optional[bool] = None,
+    file: Optional[TextIO] = None,
 ) -> Dict:
     """Compute power of test or determine parameters to obtain target power (same as power.anova.test).
 
@@ -339,64 +664,65 @@ def pwr_f2_test(
         Significance level (Type I error probability). Must be between 0 and 1
     power: float, default=None
         Power of test (1 minus Type II error probability). Must be between 0 and 1
-    print_pretty: bool, default=True
-        Whether we wish to print the results in a pretty format or not
+    print_pretty: bool, default=None
+        Whether we wish to print the results in a pretty format or not. If None, the results are only
+        printed when the output is a terminal
+    file: file-like object, default=None
+        Where the pretty-printed results are written. Defaults to sys.stdout
 
     Returns
     -------
-    A dict containing our u, v, f2, sig_level and power
+    A dict containing our u, v, f2, sig_level and power.
+    If any numeric argument is an array, the arguments are broadcast against each other and every
+    numeric entry is an array of results
     """
-    if not any(x is None for x in [u, v, f2, sig_level, power]):
-        raise ValueError("One of u, v, f2, sig_level or power must be None")
-    if sum([x is None for x in [u, v, f2, sig_level, power]]) > 1:
-        raise ValueError("Only one of u, v, f2, sig_level or power may be None")
-    if f2 is not None and f2 < 0:
-        raise ValueError("f2 must be positive")
-    if u is not None and u < 1:
-        raise ValueError("Degrees of freedom u for numerator must be at least 1")
-    if v is not None and v < 1:
-        raise ValueError("Degrees of freedom v for denominator must be at least 1")
-    if sig_level is not None and (sig_level < 0 or sig_level > 1):
-        raise ValueError("sig_level must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    pwr = pwr_f2(u, v, f2, sig_level, power).pwr_test()
-    if print_pretty:
-        str_print = (
-            "\t"
-            + pwr["method"]
-            + "\n" * 2
-            + "\t" * 2
-            + " " * 2
-            + f"u = {pwr['u']}"
-            + "\n"
-            + "\t" * 2
-            + " " * 2
-            + f"v = {pwr['v']}"
-            + "\n"
-            + "\t" * 2
-            + " "
-            + f"f2 = {pwr['effect_size']}"
-            + "\n"
-            + "\t"
-            + " " * 2
-            + f"sig_level = {pwr['sig_level']}"
-            + "\n"
-            + "\t"
-            + " " * 6
-            + f"power = {pwr['power']}"
+    mask = (
+        (u is None)
+        | (v is None) << 1
+        | (f2 is None) << 2
+        | (sig_level is None) << 3
+        | (power is None) << 4
+    )
+    _validate_mask(mask, ("u", "v", "f2", "sig_level", "power"))
+    _positive_check("f2", f2)
+    _min_check(u, 1, "Degrees of freedom u for numerator must be at least 1")
+    _min_check(v, 1, "Degrees of freedom v for denominator must be at least 1")
+    _prob_check(sig_level, power)
+    if _is_array(u, v, f2, sig_level, power):
+        return _pwr_vectorized(
+            pwr_f2_test,
+            u=u,
+            v=v,
+            f2=f2,
+            sig_level=sig_level,
+            power=power,
         )
-        print(str_print)
+    from .power_classes import pwr_f2
+
+    pwr = dict(_cached_pwr_test(pwr_f2, u, v, f2, sig_level, power))
+    if _pretty(print_pretty, file):
+        (file or sys.stdout).write(_PWR_F2_FMT % pwr)
     return pwr
 
 
+_PWR_NORM_FMT = (
+    "\t%(method)s\n\n"
+    "\t\t  d = %(effect_size)s\n"
+    "\t\t  n = %(n)s\n"
+    "\t  sig_level = %(sig_level)s\n"
+    "\t      power = %(power)s\n"
+    "\talternative = %(alternative)s\n"
+)
+
+
 def pwr_norm_test(
     d: Optional[float] = None,
     n: Optional[int] = None,
     sig_level: Optional[float] = None,
     power: Optional[float] = None,
     alternative: str = "two-sided",
-    print_pretty: bool = True,
+    print_pretty: Optional[bool] = None,
+    file: Optional[TextIO] = None,
 ) -> Dict:
     """Compute power of test or determine parameters to obtain target power (same as power.anova.test).
 
@@ -412,62 +738,62 @@ def pwr_norm_test(
         Power of test (1 minus Type II error probability). Must be between 0 and 1
     alternative: {'two-sided', 'greater', 'less'}
         A character string specifying the alternative hypothesis
-    print_pretty: bool, default=True
-        Whether we wish to print the results in a pretty format or not
+    print_pretty: bool, default=None
+        Whether we wish to print the results in a pretty format or not. If None, the results are only
+        printed when the output is a terminal
+    file: file-like object, default=None
+        Where the pretty-printed results are written. Defaults to sys.stdout
 
     Returns
     -------
-    A dict containing our d, n, sig_level, power and alternative hypothesis
+    A dict containing our d, n, sig_level, power and alternative hypothesis.
+    If any numeric argument is an array, the arguments are broadcast against each other and every
+    numeric entry is an array of results
     """
-    if not any(x is None for x in [d, n, sig_level, power]):
-        raise ValueError("One of d, n, sig_level or power must be None")
-    if sum([x is None for x in [d, n, sig_level, power]]) > 1:
-        raise ValueError("Only one of d, n, sig_level or power may be None")
-    if n is not None and n < 1:
-        raise ValueError("Number of observations in each group must be at least 1")
-    if sig_level is not None and (sig_level < 0 or sig_level > 1):
-        raise ValueError("sig_level must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    alternative = alternative.casefold()
-    if alternative == "two-sided" and d is not None:
-        d = abs(d)
-    pwr = pwr_norm(d, n, sig_level, power, alternative).pwr_test()
-    if print_pretty:
-        str_print = (
-            "\t"
-            + pwr["method"]
-            + "\n" * 2
-            + "\t" * 2
-            + " " * 2
-            + f"d = {pwr['effect_size']}"
-            + "\n"
-            + "\t" * 2
-            + " " * 2
-            + f"n = {pwr['n']}"
-            + "\n"
-            + "\t"
-            + " " * 2
-            + f"sig_level = {pwr['sig_level']}"
-            + "\n"
-            + "\t"
-            + " " * 6
-            + f"power = {pwr['power']}"
-            + "\n"
-            + "\t"
-            + f"alternative = {pwr['alternative']}"
+    mask = (
+        (d is None) | (n is None) << 1 | (sig_level is None) << 2 | (power is None) << 3
+    )
+    _validate_mask(mask, ("d", "n", "sig_level", "power"))
+    _min_check(n, 1, "Number of observations in each group must be at least 1")
+    _prob_check(sig_level, power)
+    if _is_array(d, n, sig_level, power):
+        return _pwr_vectorized(
+            pwr_norm_test,
+            d=d,
+            n=n,
+            sig_level=sig_level,
+            power=power,
+            alternative=alternative,
         )
-        print(str_print)
+    alternative = _norm_alt(alternative)
+    if alternative == "two-sided" and d is not None and d < 0:
+        d = -d
+    from .power_classes import pwr_norm
+
+    pwr = dict(_cached_pwr_test(pwr_norm, d, n, sig_level, power, alternative))
+    if _pretty(print_pretty, file):
+        (file or sys.stdout).write(_PWR_NORM_FMT % pwr)
     return pwr
 
 
+_PWR_P_FMT = (
+    "\t%(method)s\n\n"
+    "\t\t  h = %(effect_size)s\n"
+    "\t\t  n = %(n)s\n"
+    "\t  sig_level = %(sig_level)s\n"
+    "\t      power = %(power)s\n"
+    "\talternative = %(alternative)s\n"
+)
+
+
 def pwr_p_test(
     h: Optional[float] = None,
     n: Optional[int] = None,
     sig_level: Optional[float] = None,
     power: Optional[float] = None,
     alternative: str = "two-sided",
-    print_pretty: bool = True,
+    print_pretty: Optional[bool] = None,
+    file: Optional[TextIO] = None,
 ) -> Dict:
     """Compute power of test or determine parameters to obtain target power (same as power.anova.test).
 
@@ -483,62 +809,62 @@ def pwr_p_test(
         Power of test (1 minus Type II error probability). Must be between 0 and 1
     alternative: {'two-sided', 'greater', 'less'}
         A character string specifying the alternative hypothesis
-    print_pretty: bool, default=True
-        Whether we wish to print the results in a pretty format or not
+    print_pretty: bool, default=None
+        Whether we wish to print the results in a pretty format or not. If None, the results are only
+        printed when the output is a terminal
+    file: file-like object, default=None
+        Where the pretty-printed results are written. Defaults to sys.stdout
 
     Returns
     -------
-    A dict containing our h, n, sig_level, power and alternative hypothesis
+    A dict containing our h, n, sig_level, power and alternative hypothesis.
+    If any numeric argument is an array, the arguments are broadcast against each other and every
+    numeric entry is an array of results
     """
-    if not any(x is None for x in [h, n, sig_level, power]):
-        raise ValueError("One of h, n, sig_level or power must be None")
-    if sum([x is None for x in [h, n, sig_level, power]]) > 1:
-        raise ValueError("Only one of h, n, sig_level or power may be None")
-    if n is not None and n < 1:
-        raise ValueError("Number of observations in each group must be at least 1")
-    if sig_level is not None and (sig_level < 0 or sig_level > 1):
-        raise ValueError("sig_level must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    alternative = alternative.casefold()
-    if h is not None and alternative == "two-sided":
-        h = abs(h)
-    pwr = pwr_p(h, n, sig_level, power, alternative).pwr_test()
-    if print_pretty:
-        str_print = (
-            "\t"
-            + pwr["method"]
-            + "\n" * 2
-            + "\t" * 2
-            + " " * 2
-            + f"h = {pwr['effect_size']}"
-            + "\n"
-            + "\t" * 2
-            + " " * 2
-            + f"n = {pwr['n']}"
-            + "\n"
-            + "\t"
-            + " " * 2
-            + f"sig_level = {pwr['sig_level']}"
-            + "\n"
-            + "\t"
-            + " " * 6
-            + f"power = {pwr['power']}"
-            + "\n"
-            + "\t"
-            + f"alternative = {pwr['alternative']}"
+    mask = (
+        (h is None) | (n is None) << 1 | (sig_level is None) << 2 | (power is None) << 3
+    )
+    _validate_mask(mask, ("h", "n", "sig_level", "power"))
+    _min_check(n, 1, "Number of observations in each group must be at least 1")
+    _prob_check(sig_level, power)
+    if _is_array(h, n, sig_level, power):
+        return _pwr_vectorized(
+            pwr_p_test,
+            h=h,
+            n=n,
+            sig_level=sig_level,
+            power=power,
+            alternative=alternative,
         )
-        print(str_print)
+    alternative = _norm_alt(alternative)
+    if alternative == "two-sided" and h is not None and h < 0:
+        h = -h
+    from .power_classes import pwr_p
+
+    pwr = dict(_cached_pwr_test(pwr_p, h, n, sig_level, power, alternative))
+    if _pretty(print_pretty, file):
+        (file or sys.stdout).write(_PWR_P_FMT % pwr)
     return pwr
 
 
+_PWR_R_FMT = (
+    "\t%(method)s\n\n"
+    "\t\t  r = %(effect_size)s\n"
+    "\t\t  n = %(n)s\n"
+    "\t  sig_level = %(sig_level)s\n"
+    "\t      power = %(power)s\n"
+    "\talternative = %(alternative)s\n"
+)
+
+
 def pwr_r_test(
     n: Optional[int] = None,
     r: Optional[float] = None,
     sig_level: Optional[float] = None,
     power: Optional[float] = None,
     alternative: str = "two-sided",
-    print_pretty: bool = True,
+    print_pretty: Optional[bool] = None,
+    file: Optional[TextIO] = None,
 ) -> Dict:
     """Compute power of test or determine parameters to obtain target power (same as power.anova.test).
 
@@ -554,55 +880,55 @@ def pwr_r_test(
         Power of test (1 minus Type II error probability). Must be between 0 and 1
     alternative: {'two-sided', 'greater', 'less'}
         A character string specifying the alternative hypothesis
-    print_pretty: bool, default=True
-        Whether we wish to print the results in a pretty format or not
+    print_pretty: bool, default=None
+        Whether we wish to print the results in a pretty format or not. If None, the results are only
+        printed when the output is a terminal
+    file: file-like object, default=None
+        Where the pretty-printed results are written. Defaults to sys.stdout
 
     Returns
     -------
-    A dict containing our h, n, sig_level, power and alternative hypothesis
+    A dict containing our h, n, sig_level, power and alternative hypothesis.
+    If any numeric argument is an array, the arguments are broadcast against each other and every
+    numeric entry is an array of results
     """
-    if not any(x is None for x in [r, n, sig_level, power]):
-        raise ValueError("One of r, n, sig_level or power must be None")
-    if sum([x is None for x in [r, n, sig_level, power]]) > 1:
-        raise ValueError("Only one of r, n, sig_level or power may be None")
-    if n is not None and n < 4:
-        raise ValueError("Number of observations must be at least 4")
-    if sig_level is not None and (sig_level < 0 or sig_level > 1):
-        raise ValueError("sig_level must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    alternative = alternative.casefold()
-    if alternative == "two-sided" and r is not None:
-        r = abs(r)
-    pwr = pwr_r(r, n, sig_level, power, alternative).pwr_test()
-    if print_pretty:
-        str_print = (
-            "\t"
-            + pwr["method"]
-            + "\n" * 2
-            + "\t" * 2
-            + " " * 2
-            + f"r = {pwr['effect_size']}"
-            + "\n"
-            + "\t" * 2
-            + " " * 2
-            + f"n = {pwr['n']}"
-            + "\n"
-            + "\t"
-            + " " * 2
-            + f"sig_level = {pwr['sig_level']}"
-            + "\n"
-            + "\t"
-            + " " * 6
-            + f"power = {pwr['power']}"
-            + "\n"
-            + "\t"
-            + f"alternative = {pwr['alternative']}"
+    mask = (
+        (r is None) | (n is None) << 1 | (sig_level is None) << 2 | (power is None) << 3
+    )
+    _validate_mask(mask, ("r", "n", "sig_level", "power"))
+    _min_check(n, 4, "Number of observations must be at least 4")
+    _prob_check(sig_level, power)
+    if _is_array(n, r, sig_level, power):
+        return _pwr_vectorized(
+            pwr_r_test,
+            n=n,
+            r=r,
+            sig_level=sig_level,
+            power=power,
+            alternative=alternative,
         )
-        print(str_print)
+    alternative = _norm_alt(alternative)
+    if alternative == "two-sided" and r is not None and r < 0:
+        r = -r
+    from .power_classes import pwr_r
+
+    pwr = dict(_cached_pwr_test(pwr_r, r, n, sig_level, power, alternative))
+    if _pretty(print_pretty, file):
+        (file or sys.stdout).write(_PWR_R_FMT % pwr)
     return pwr
 
 
+_PWR_T_FMT = (
+    "\t%(method)s\n\n"
+    "\t\t  d = %(effect_size)s\n"
+    "\t\t  n = %(n)s\n"
+    "\t  sig_level = %(sig_level)s\n"
+    "\t      power = %(power)s\n"
+    "\talternative = %(alternative)s\n"
+)
+_PWR_T_NOTE_FMT = _PWR_T_FMT + "\nNOTE: %(note)s\n"
+
+
 def pwr_t_test(
     n: Optional[int] = None,
     d: Optional[float] = None,
@@ -610,7 +936,8 @@ def pwr_t_test(
     power: Optional[float] = None,
     test_type: str = "paired",
     alternative: str = "two-sided",
-    print_pretty: bool = True,
+    print_pretty: Optional[bool] = None,
+    file: Optional[TextIO] = None,
 ) -> Dict:
     """Compute power of tests or determine parameters to obtain target power (similar to as power.t.test)
 
@@ -628,79 +955,59 @@ def pwr_t_test(
         Type of t-test: One sample, two sample or paired sample
     alternative: {'two-sided', 'greater', 'less'}
         A character string specifying the alternative hypothesis
-    print_pretty: bool, default=True
-        Whether we wish to print the results in a pretty format or not
+    print_pretty: bool, default=None
+        Whether we wish to print the results in a pretty format or not. If None, the results are only
+        printed when the output is a terminal
+    file: file-like object, default=None
+        Where the pretty-printed results are written. Defaults to sys.stdout
 
     Returns
     -------
-    A dict containing our n, d, sig_level, power and alternative hypothesis
+    A dict containing our n, d, sig_level, power and alternative hypothesis.
+    If any numeric argument is an array, the arguments are broadcast against each other and every
+    numeric entry is an array of results
     """
-    if not any(x is None for x in [n, d, sig_level, power]):
-        raise ValueError("One of n, d, sig_level or power must be None")
-    if sum([x is None for x in [n, d, sig_level, power]]) > 1:
-        raise ValueError("Only one of n, d, sig_level or power may be None")
-    if n is not None and n < 2:
-        raise ValueError("Number of observations must be at least 2")
-    if sig_level is not None and (sig_level < 0 or sig_level > 1):
-        raise ValueError("sig_level must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    pwr = pwr_t(n, d, sig_level, power, test_type, alternative).pwr_test()
-    if print_pretty:
-        if "note" in pwr.keys():
-            str_print = (
-                "\t"
-                + pwr["method"]
-                + "\n" * 2
-                + "\t" * 2
-                + " " * 2
-                + f"d = {pwr['effect_size']}"
-                + "\n"
-                + "\t" * 2
-                + " " * 2
-                + f"n = {pwr['n']}"
-                + "\n"
-                + "\t"
-                + " " * 2
-                + f"sig_level = {pwr['sig_level']}"
-                + "\n"
-                + "\t"
-                + " " * 6
-                + f"power = {pwr['power']}"
-                + "\n"
-                + "\t"
-                + f"alternative = {pwr['alternative']}"
-                + "\n" * 2
-                + f"NOTE: {pwr['note']}"
-            )
-        else:
-            str_print = (
-                "\t"
-                + pwr["method"]
-                + "\n" * 2
-                + "\t" * 2
-                + " " * 2
-                + f"d = {pwr['effect_size']}"
-                + "\n"
-                + "\t" * 2
-                + " " * 2
-                + f"n = {pwr['n']}"
-                + "\n"
-                + "\t"
-                + " " * 2
-                + f"sig_level = {pwr['sig_level']}"
-                + "\n"
-                + "\t"
-                + " " * 6
-                + f"power = {pwr['power']}"
-                + "\n"
-                + "\t"
-                + f"alternative = {pwr['alternative']}"
-            )
-        print(str_print)
+    mask = (
+        (n is None) | (d is None) << 1 | (sig_level is None) << 2 | (power is None) << 3
+    )
+    _validate_mask(mask, ("n", "d", "sig_level", "power"))
+    _min_check(n, 2, "Number of observations must be at least 2")
+    _prob_check(sig_level, power)
+    if _is_array(n, d, sig_level, power):
+        return _pwr_vectorized(
+            pwr_t_test,
+            n=n,
+            d=d,
+            sig_level=sig_level,
+            power=power,
+            test_type=test_type,
+            alternative=alternative,
+        )
+    alternative = _norm_alt(alternative)
+    if alternative == "two-sided" and d is not None and d < 0:
+        d = -d
+    from .power_classes import pwr_t
+
+    pwr = dict(_cached_pwr_test(pwr_t, n, d, sig_level, power, test_type, alternative))
+    if _pretty(print_pretty, file):
+        (file or sys.stdout).write(
+            (_PWR_T_NOTE_FMT if "note" in pwr else _PWR_T_FMT) % pwr
+        )
     return pwr
 
 
+_PWR_T2N_FMT = (
+    "\t%(method)s\n\n"
+    "\t\t  d = %(effect_size)s\n"
+    "\t\t n1 = %(n1)s\n"
+    "\t\t n2 = %(n2)s\n"
+    "\t  sig_level = %(sig_level)s\n"
+    "\t      power = %(power)s\n"
+    "\talternative = %(alternative)s\n\n"
+    "NOTE: %(note)s\n"
+)
+
+
 def pwr_t2n_test(
     n1: Optional[int] = None,
     n2: Optional[int] = None,
@@ -708,7 +1015,8 @@ def pwr_t2n_test(
     sig_level: Optional[float] = None,
     power: Optional[float] = None,
     alternative: str = "two-sided",
-    print_pretty: bool = True,
+    print_pretty: Optional[bool] = None,
+    file: Optional[TextIO] = None,
 ) -> Dict:
     """Compute power of tests or determine parameters to obtain target power (similar to as power.t.test)
 
@@ -726,60 +1034,45 @@ def pwr_t2n_test(
         Power of test (1 minus Type II error probability). Must be between 0 and 1
     alternative: {'two-sided', 'greater', 'less'}
         A character string specifying the alternative hypothesis
-    print_pretty: bool, default=True
-        Whether we wish to print the results in a pretty format or not
+    print_pretty: bool, default=None
+        Whether we wish to print the results in a pretty format or not. If None, the results are only
+        printed when the output is a terminal
+    file: file-like object, default=None
+        Where the pretty-printed results are written. Defaults to sys.stdout
 
     Returns
     -------
-    A dict containing our n1, n2, d, sig_level, power and alternative hypothesis
+    A dict containing our n1, n2, d, sig_level, power and alternative hypothesis.
+    If any numeric argument is an array, the arguments are broadcast against each other and every
+    numeric entry is an array of results
     """
-    if not any(x is None for x in [n1, n2, d, sig_level, power]):
-        raise ValueError("One of n1, n2, d sig_level or power must be None")
-    if sum([x is None for x in [n1, n2, d, sig_level, power]]) > 1:
-        raise ValueError("Only one of n1, n2, d, sig_level or power may be None")
-    if n1 is not None and n1 < 2:
-        raise ValueError("Number of observations in the first group must be at least 2")
-    if n2 is not None and n2 < 2:
-        raise ValueError(
-            "Number of observations in the second group must be at least 2"
+    mask = (
+        (n1 is None)
+        | (n2 is None) << 1
+        | (d is None) << 2
+        | (sig_level is None) << 3
+        | (power is None) << 4
+    )
+    _validate_mask(mask, ("n1", "n2", "d", "sig_level", "power"))
+    _min_check(n1, 2, "Number of observations in the first group must be at least 2")
+    _min_check(n2, 2, "Number of observations in the second group must be at least 2")
+    _prob_check(sig_level, power)
+    if _is_array(n1, n2, d, sig_level, power):
+        return _pwr_vectorized(
+            pwr_t2n_test,
+            n1=n1,
+            n2=n2,
+            d=d,
+            sig_level=sig_level,
+            power=power,
+            alternative=alternative,
         )
-    if sig_level is not None and (sig_level < 0 or sig_level > 1):
-        raise ValueError("sig_level must be between 0 and 1")
-    if power is not None and (power < 0 or power > 1):
-        raise ValueError("power must be between 0 and 1")
-    alternative = alternative.casefold()
-    if alternative == "two-sided" and d is not None:
-        d = abs(d)
-    pwr = pwr_t2n(d, n1, n2, sig_level, power, alternative).pwr_test()
-    if print_pretty:
-        str_print = (
-            "\t"
-            + pwr["method"]
-            + "\n" * 2
-            + "\t" * 2
-            + " " * 2
-            + f"d = {pwr['effect_size']}"
-            + "\n"
-            + "\t" * 2
-            + " "
-            + f"n1 = {pwr['n1']}"
-            + "\n"
-            + "\t" * 2
-            + " "
-            + f"n2 = {pwr['n2']}"
-            + "\n"
-            + "\t"
-            + " " * 2
-            + f"sig_level = {pwr['sig_level']}"
-            + "\n"
-            + "\t"
-            + " " * 6
-            + f"power = {pwr['power']}"
-            + "\n"
-            + "\t"
-            + f"alternative = {pwr['alternative']}"
-            + "\n" * 2
-            + f"NOTE: {pwr['note']}"
-        )
-        print(str_print)
+    alternative = _norm_alt(alternative)
+    if alternative == "two-sided" and d is not None and d < 0:
+        d = -d
+    from .power_classes import pwr_t2n
+
+    pwr = dict(_cached_pwr_test(pwr_t2n, d, n1, n2, sig_level, power, alternative))
+    if _pretty(print_pretty, file):
+        (file or sys.stdout).write(_PWR_T2N_FMT % pwr)
     return pwr
@@ -1,3 +1,6 @@
+import io
+
+import numpy as np
 import pytest
 
 import src.pwr_tests as pwr_tests
@@ -30,7 +33,14 @@ class Test_2p:
             pwr_tests.pwr_2p_test(None, 1, 0.05, -0.5)
 
     @staticmethod
-    def test_2p_results() -> None:
+    def test_2p_alternative() -> None:
+        with pytest.raises(ValueError, match="alternative must be one of 'two-sided', 'greater' or 'less'"):
+            pwr_tests.pwr_2p_test(0.3, 200, 0.05, None, 'both')
+        r_style = pwr_tests.pwr_2p_test(0.3, 200, 0.05, None, 'two.sided')
+        assert r_style == pwr_tests.pwr_2p_test(0.3, 200, 0.05, None, 'two-sided')
+
+    @staticmethod
+    def test_2p_power_result() -> None:
         p_results = pwr_tests.pwr_2p_test(h=0.3, n=200, sig_level=0.05, alternative='greater')
         # pwr.2p.test(h=0.3,n=200, sig.level=0.05, alternative="greater")
         #
@@ -46,6 +56,8 @@ class Test_2p:
         expected = 0.9123145
         assert p_results['power'] == pytest.approx(expected, 0.000001)
 
+    @staticmethod
+    def test_2p_effect_size_result() -> None:
         h_results = pwr_tests.pwr_2p_test(n=200, sig_level=0.05, power=0.8, alternative='two-sided')
         # pwr.2p.test(n=200, sig.level=0.05, power=0.8, alternative="two.sided")
         #
@@ -61,6 +73,8 @@ class Test_2p:
         expected = 0.2801491
         assert h_results['effect_size'] == pytest.approx(expected, 0.0001)
 
+    @staticmethod
+    def test_2p_n_result() -> None:
         n_results = pwr_tests.pwr_2p_test(h=-0.3, sig_level=0.05, power=0.8, alternative='less')
         # pwr.2p.test(h=-0.3, sig.level=0.05, power=0.8, alternative="less")
         #
@@ -76,6 +90,8 @@ class Test_2p:
         expected = 138
         assert n_results['n'] == expected
 
+    @staticmethod
+    def test_2p_sig_level_result() -> None:
         sig_results = pwr_tests.pwr_2p_test(h=0.3, n=200, power=0.8, alternative='two-sided')
         # pwr.2p.test(h=0.3, n=200, sig.level=NULL, power=0.8, alternative="two.sided")
         #
@@ -91,6 +107,110 @@ class Test_2p:
         expected = 0.03089736
         assert sig_results['sig_level'] == pytest.approx(expected, 0.0001)
 
+    @staticmethod
+    def test_2p_array() -> None:
+        results = pwr_tests.pwr_2p_test(h=np.array([0.3, -0.3]), n=np.array([[200], [137]]), sig_level=0.05,
+                                        alternative='greater')
+        assert results['power'].shape == (2, 2)
+        assert results['power'][0, 0] == pytest.approx(0.9123145, 0.000001)
+        expected = pwr_tests.pwr_2p_test(h=-0.3, n=137, sig_level=0.05, alternative='greater', print_pretty=False)
+        assert results['power'][1, 1] == pytest.approx(expected['power'])
+
+        n_results = pwr_tests.pwr_2p_test(h=-0.3, sig_level=np.array([0.05, 0.1]), power=0.8, alternative='less')
+        assert n_results['n'][0] == 138
+        assert n_results['alternative'] == 'less'
+
+    @staticmethod
+    def test_2p_array_checks() -> None:
+        pwr_tests.clear_pwr_caches()
+        pwr_tests.pwr_2p_test(h=np.array([0.1, 0.5]), n=np.array([50, 500]), sig_level=0.05)
+        assert pwr_tests._cached_pwr_test.cache_info().currsize == 0
+        with pytest.raises(ValueError, match="sig_level must be between 0 and 1"):
+            pwr_tests.pwr_2p_test(h=0.3, n=200, sig_level=np.array([0.05, np.nan]))
+        with pytest.raises(ValueError, match="power must be between 0 and 1"):
+            pwr_tests.pwr_map(pwr_tests.pwr_2p_test, h=0.3, sig_level=0.05, power=np.array([0.8, 1.2]))
+
+    @staticmethod
+    def test_2p_empty_array() -> None:
+        with pytest.raises(ValueError, match="Array arguments must not be empty"):
+            pwr_tests.pwr_2p_test(h=np.array([]), n=200, sig_level=0.05)
+        with pytest.raises(ValueError, match="Array arguments must not be empty"):
+            pwr_tests.pwr_2p_test(h=np.array([]), sig_level=0.05, power=0.8)
+
+    @staticmethod
+    def test_2p_map() -> None:
+        h = np.array([0.2, 0.3, 0.4])
+        expected = pwr_tests.pwr_2p_test(h=h, sig_level=0.05, power=0.8, alternative='greater')
+        results = pwr_tests.pwr_map(pwr_tests.pwr_2p_test, workers=2, h=h, sig_level=0.05, power=0.8,
+                                    alternative='greater')
+        assert np.array_equal(results['n'], expected['n'])
+        assert results['n'][1] == 138
+        pretty = pwr_tests.pwr_map(pwr_tests.pwr_2p_test, workers=2, h=h, sig_level=0.05, power=0.8,
+                                   alternative='greater', print_pretty=True)
+        assert np.array_equal(pretty['n'], expected['n'])
+
+    @staticmethod
+    def test_2p_cache() -> None:
+        first = pwr_tests.pwr_2p_test(h=0.3, n=200, sig_level=0.05, alternative='greater')
+        first['power'] = None
+        second = pwr_tests.pwr_2p_test(h=0.3, n=200, sig_level=0.05, alternative='greater')
+        assert second['power'] == pytest.approx(0.9123145, 0.000001)
+        pwr_tests.clear_pwr_caches()
+        assert pwr_tests._cached_pwr_test.cache_info().currsize == 0
+
+    @staticmethod
+    def test_2p_print(capsys) -> None:
+        pwr_tests.pwr_2p_test(h=0.3, n=200, sig_level=0.05)
+        assert capsys.readouterr().out == ''
+        pwr_tests.pwr_2p_test(h=0.3, n=200, sig_level=0.05, print_pretty=True)
+        assert 'NOTE: Same sample sizes' in capsys.readouterr().out
+        out = io.StringIO()
+        pwr_tests.pwr_2p_test(h=0.3, n=200, sig_level=0.05, file=out)
+        assert out.getvalue() == ''
+        pwr_tests.pwr_2p_test(h=0.3, n=200, sig_level=0.05, print_pretty=True, file=out)
+        assert 'NOTE: Same sample sizes' in out.getvalue()
+        assert capsys.readouterr().out == ''
+
+    @staticmethod
+    def test_2p_print_stream(monkeypatch) -> None:
+        class WriteOnly:
+            def __init__(self) -> None:
+                self.text = ''
+
+            def write(self, text: str) -> None:
+                self.text += text
+
+        out = WriteOnly()
+        pwr_tests.pwr_2p_test(h=0.3, n=200, sig_level=0.05, file=out)
+        assert out.text == ''
+        pwr_tests.pwr_2p_test(h=0.3, n=200, sig_level=0.05, print_pretty=True, file=out)
+        assert 'NOTE: Same sample sizes' in out.text
+        monkeypatch.setattr('sys.stdout', None)
+        assert pwr_tests.pwr_2p_test(h=0.3, n=200, sig_level=0.05)['power'] == pytest.approx(0.8508388, 0.0001)
+
+    @staticmethod
+    def test_2p_zero_h() -> None:
+        with pytest.raises(ValueError):
+            pwr_tests.pwr_2p_test(h=0, sig_level=0.05, power=0.8, alternative='greater')
+
+    @staticmethod
+    def test_2p_less() -> None:
+        greater = pwr_tests.pwr_2p_test(h=0.3, n=80, power=0.8, alternative='greater')
+        less = pwr_tests.pwr_2p_test(h=-0.3, n=80, power=0.8, alternative='less')
+        assert less['sig_level'] == pytest.approx(greater['sig_level'], 0.000001)
+
+    @staticmethod
+    def test_2p_grid() -> None:
+        grid = pwr_tests.pwr_2p_grid([0.2, 0.3], [100, 200, 300], 0.05, alternative='greater')
+        assert grid.shape == (2, 3)
+        assert grid[1, 1] == pytest.approx(0.9123145, 0.000001)
+        expected = pwr_tests.pwr_2p_test(h=0.2, n=300, sig_level=0.05, alternative='greater')
+        assert grid[0, 2] == pytest.approx(expected['power'])
+        with pytest.raises(ValueError, match="h_arr, n_arr and sig_level must all be given"):
+            pwr_tests.pwr_2p_grid([0.2, 0.3], [100, 200], None)
+        with pytest.raises(ValueError, match="Number of observations must be at least 1"):
+            pwr_tests.pwr_2p_grid([0.2, 0.3], [100, -5], 0.05)
+
 
 class Test_2p2n:
 
@@ -119,7 +239,14 @@ class Test_2p2n:
             pwr_tests.pwr_2p2n_test(None, 2, 2, 0.05, -0.5)
 
     @staticmethod
-    def test_2p2n_result() -> None:
+    def test_2p2n_alternative() -> None:
+        with pytest.raises(ValueError, match="alternative must be one of 'two-sided', 'greater' or 'less'"):
+            pwr_tests.pwr_2p2n_test(h=0.3, n1=80, n2=245, sig_level=0.05, alternative='both')
+        r_style = pwr_tests.pwr_2p2n_test(h=0.3, n1=80, n2=245, sig_level=0.05, alternative='two.sided')
+        assert r_style == pwr_tests.pwr_2p2n_test(h=0.3, n1=80, n2=245, sig_level=0.05, alternative='two-sided')
+
+    @staticmethod
+    def test_2p2n_power_result() -> None:
         p_results = pwr_tests.pwr_2p2n_test(h=0.30, n1=80, n2=245, sig_level=0.05, alternative="greater")
         # pwr.2p2n.test(h=0.30,n1=80,n2=245,sig.level=0.05,alternative="greater")
         #
@@ -136,6 +263,8 @@ class Test_2p2n:
         expected = 0.7532924
         assert p_results['power'] == pytest.approx(expected, 0.0000001)
 
+    @staticmethod
+    def test_2p2n_effect_size_result() -> None:
         h_results = pwr_tests.pwr_2p2n_test(n1=1600, n2=3000, power=0.8, sig_level=0.1, alternative="less")
         # pwr.2p2n.test(n1=1600,n2=3000,power=0.8,sig.level=0.1,alternative="less")
         #
@@ -152,6 +281,8 @@ class Test_2p2n:
         expected = -0.06572994
         assert h_results['effect_size'] == pytest.approx(expected, 0.0001)
 
+    @staticmethod
+    def test_2p2n_n1_result() -> None:
         n1_result = pwr_tests.pwr_2p2n_test(h=0.3, n2=1000, power=0.8, sig_level=0.05, alternative='two-sided')
         # pwr.2p2n.test(h=0.3, n2=1000, power=0.8, sig.level=0.05, alternative='two.sided')
         #
@@ -168,6 +299,8 @@ class Test_2p2n:
         expected = 96
         assert n1_result['n1'] == expected
 
+    @staticmethod
+    def test_2p2n_n2_result() -> None:
         n2_results = pwr_tests.pwr_2p2n_test(h=0.20, n1=1600, power=0.9, sig_level=0.01, alternative="two-sided")
         # pwr.2p2n.test(h=0.20,n1=1600,power=0.9,sig.level=0.01,alternative="two.sided")
         #
@@ -184,6 +317,8 @@ class Test_2p2n:
         expected = 485
         assert n2_results['n2'] == expected
 
+    @staticmethod
+    def test_2p2n_sig_level_result() -> None:
         s_results = pwr_tests.pwr_2p2n_test(h=0.3, n1=100, n2=1000, power=0.8, alternative='two-sided')
         # pwr.2p2n.test(h=0.3, n1=500, n2=1000, power=0.8, sig.level=NULL, alternative='two.sided')
         #
@@ -200,6 +335,17 @@ class Test_2p2n:
         expected = 0.04352786
         assert s_results['sig_level'] == pytest.approx(expected, 0.001)
 
+    @staticmethod
+    def test_2p2n_array() -> None:
+        p_results = pwr_tests.pwr_2p2n_test(h=np.array([0.3, -0.3]), n1=80, n2=np.array([[245], [100]]),
+                                            sig_level=0.05, alternative='greater')
+        assert p_results['power'].shape == (2, 2)
+        assert p_results['power'][0, 0] == pytest.approx(0.7532924, 0.000001)
+        expected = pwr_tests.pwr_2p2n_test(h=-0.3, n1=80, n2=100, sig_level=0.05, alternative='greater')
+        assert p_results['power'][1, 1] == pytest.approx(expected['power'])
+        with pytest.raises(ValueError, match="Number of observations in the second group must be at least 2"):
+            pwr_tests.pwr_2p2n_test(h=0.3, n1=80, n2=np.array([245, 1]), sig_level=0.05)
+
 
 class Test_Anova:
     @staticmethod
@@ -242,7 +388,7 @@ class Test_Anova:
             pwr_tests.pwr_anova_test(None, 2, 2, 0.05, -0.5)
 
     @staticmethod
-    def test_anova_results() -> None:
+    def test_anova_power_result() -> None:
         p_results = pwr_tests.pwr_anova_test(f=0.28, k=4, n=20, sig_level=0.05)
         # pwr.anova.test(f=0.28,k=4,n=20,sig.level=0.05)
         #
@@ -258,6 +404,8 @@ class Test_Anova:
         expected = 0.5149793
         assert p_results['power'] == pytest.approx(expected, 0.00001)
 
+    @staticmethod
+    def test_anova_k_result() -> None:
         k_results = pwr_tests.pwr_anova_test(f=0.1, n=50, power=0.80, sig_level=0.05)
         # pwr.anova.test(f=0.1, n=50, power=0.80, sig.level=0.05)
         #
@@ -273,6 +421,8 @@ class Test_Anova:
         expected = 71
         assert k_results['k'] == expected
 
+    @staticmethod
+    def test_anova_n_result() -> None:
         n_results = pwr_tests.pwr_anova_test(f=0.28, k=4, power=0.80, sig_level=0.05)
         # pwr.anova.test(f=0.28,k=4,power=0.80,sig.level=0.05)
         #
@@ -288,6 +438,8 @@ class Test_Anova:
         expected = 36
         assert n_results['n'] == expected
 
+    @staticmethod
+    def test_anova_effect_size_result() -> None:
         f_results = pwr_tests.pwr_anova_test(k=5, n=10, power=0.80, sig_level=0.05)
         # pwr.anova.test(k=5, n=10, power=0.80, sig.level=0.05)
         #
@@ -303,6 +455,8 @@ class Test_Anova:
         expected = 0.5148773
         assert f_results['effect_size'] == pytest.approx(expected, 0.0001)
 
+    @staticmethod
+    def test_anova_sig_level_result() -> None:
         s_results = pwr_tests.pwr_anova_test(k=3, n=20, f=0.5, power=0.8)
         # pwr.anova.test(k=3, n=20, f=0.5, power=0.8, sig.level=NULL)
         #
@@ -355,7 +509,7 @@ class Test_Chisq:
             pwr_tests.pwr_chisq_test(None, 2, 2, 0.05, -0.5)
 
     @staticmethod
-    def test_chisq_results() -> None:
+    def test_chisq_power_result() -> None:
         p_results = pwr_tests.pwr_chisq_test(w=0.289, df=3, n=100, sig_level=0.05)
         # pwr.chisq.test(w=0.289,df=(4-1),N=100,sig.level=0.05)
         #
@@ -371,6 +525,8 @@ class Test_Chisq:
         expected = 0.6750777
         assert p_results['power'] == pytest.approx(expected, 0.00001)
 
+    @staticmethod
+    def test_chisq_effect_size_result() -> None:
         w_results = pwr_tests.pwr_chisq_test(n=300, df=30, power=0.80, sig_level=0.05)
         # pwr.chisq.test(N=300, df=30, power=0.80, sig.level=0.05)
         #
@@ -386,6 +542,8 @@ class Test_Chisq:
         expected = 0.2860569
         assert w_results['effect_size'] == pytest.approx(expected, 0.0002)
 
+    @staticmethod
+    def test_chisq_n_result() -> None:
         n_results = pwr_tests.pwr_chisq_test(w=0.1, df=(5-1)*(6-1), power=0.80, sig_level=0.05)
         # pwr.chisq.test(w=0.1,df=(5-1)*(6-1),power=0.80,sig.level=0.05)
         #
@@ -401,6 +559,8 @@ class Test_Chisq:
         expected = 2097
         assert n_results['n'] == expected
 
+    @staticmethod
+    def test_chisq_sig_level_result() -> None:
         s_results = pwr_tests.pwr_chisq_test(w=0.25, n=300, df=30, power=0.80)
         # pwr.chisq.test(w=0.25, N=300, df=30, power=0.80, sig.level = NULL)
         #
@@ -458,7 +618,15 @@ class Test_f2:
             pwr_tests.pwr_f2_test(None, 2, 2, 0.05, -0.5)
 
     @staticmethod
-    def test_f2_results() -> None:
+    def test_f2_small_v() -> None:
+        # With few residual degrees of freedom the effect size is large enough that ncfdtr can return nan
+        for power in (0.5, 0.8, 0.95):
+            result = pwr_tests.pwr_f2_test(u=2, v=10, sig_level=0.05, power=power)
+            assert pwr_tests.pwr_f2_test(u=2, v=10, f2=result['effect_size'], sig_level=0.05)['power'] == pytest.approx(power)
+        assert pwr_tests.pwr_f2_test(u=2, v=10, sig_level=0.05, power=0.8)['effect_size'] == pytest.approx(1.015871, 0.0001)
+
+    @staticmethod
+    def test_f2_power_result() -> None:
         p_result = pwr_tests.pwr_f2_test(u=5, v=89, f2=0.1/(1-0.1), sig_level=0.05)
         # pwr.f2.test(u=5,v=89,f2=0.1/(1-0.1),sig.level=0.05)
         #
@@ -472,6 +640,8 @@ class Test_f2:
         expected = 0.6735858
         assert p_result['power'] == pytest.approx(expected, 0.00001)
 
+    @staticmethod
+    def test_f2_u_result() -> None:
         u_result = pwr_tests.pwr_f2_test(v=90, f2=0.3, sig_level=0.05, power=0.8)
         # pwr.f2.test(v=90,f2=0.3,sig.level=0.05, power=0.8)
         #
@@ -485,6 +655,8 @@ class Test_f2:
         expected = 56
         assert u_result['u'] == expected
 
+    @staticmethod
+    def test_f2_v_result() -> None:
         v_result = pwr_tests.pwr_f2_test(u=90, f2=0.01, sig_level=0.05, power=0.8)
         # pwr.f2.test(u=90,f2=0.01,sig.level=0.05, power=0.8)
         #
@@ -498,6 +670,8 @@ class Test_f2:
         expected = 3841
         assert v_result['v'] == expected
 
+    @staticmethod
+    def test_f2_effect_size_result() -> None:
         f2_result = pwr_tests.pwr_f2_test(u=100, v=1000, sig_level=0.1, power=0.8)
         # pwr.f2.test(u=100, v=1000, sig.level=0.1, power=0.8)
         #
@@ -511,6 +685,8 @@ class Test_f2:
         expected = 0.03279811
         assert f2_result['effect_size'] == pytest.approx(expected, 0.001)
 
+    @staticmethod
+    def test_f2_sig_level_result() -> None:
         s_result = pwr_tests.pwr_f2_test(f2=0.15, u=100, v=130, power=0.8)
         # pwr.f2.test(f=0.15, u=100, v=130, power=0.8, sig.level = NULL)
         #
@@ -548,6 +724,18 @@ class Test_Norm:
         with pytest.raises(ValueError, match="Number of observations in each group must be at least 1"):
             pwr_tests.pwr_norm_test(None, 0, 0.8, 0.5, 'less')
 
+    @staticmethod
+    def test_norm_zero_d() -> None:
+        with pytest.raises(ValueError):
+            pwr_tests.pwr_norm_test(d=0, sig_level=0.05, power=0.8, alternative='less')
+
+    @staticmethod
+    def test_norm_alternative() -> None:
+        with pytest.raises(ValueError, match="alternative must be one of 'two-sided', 'greater' or 'less'"):
+            pwr_tests.pwr_norm_test(d=0.3, n=30, sig_level=0.05, alternative='both')
+        r_style = pwr_tests.pwr_norm_test(d=0.3, n=30, sig_level=0.05, alternative='two.sided')
+        assert r_style == pwr_tests.pwr_norm_test(d=0.3, n=30, sig_level=0.05, alternative='two-sided')
+
     @staticmethod
     def test_f2_power() -> None:
         with pytest.raises(ValueError, match="power must be between 0 and 1"):
@@ -556,7 +744,7 @@ class Test_Norm:
             pwr_tests.pwr_norm_test(None, 2, 0.05, -0.5, 'two-sided')
 
     @staticmethod
-    def test_norm_results() -> None:
+    def test_norm_power_result() -> None:
         p_results = pwr_tests.pwr_norm_test(d=1/3, n=20, sig_level=0.05, alternative='greater')
         # pwr.norm.test(d=d,n=20,sig.level=0.05,alternative="greater")
         #
@@ -570,6 +758,8 @@ class Test_Norm:
         expected = 0.438749
         assert p_results['power'] == pytest.approx(expected, 0.00001)
 
+    @staticmethod
+    def test_norm_effect_size_result() -> None:
         d_results = pwr_tests.pwr_norm_test(n=30, power=0.8, sig_level=0.05, alternative='two-sided')
         # pwr.norm.test(n=30, power=0.8, sig.level=0.05, alternative='two.sided')
         #
@@ -583,6 +773,8 @@ class Test_Norm:
         expected = 0.5114965
         assert d_results['effect_size'] == pytest.approx(expected, 0.00001)
 
+    @staticmethod
+    def test_norm_n_result() -> None:
         n_results = pwr_tests.pwr_norm_test(d=1/3, power=0.8, sig_level=0.05, alternative='greater')
         # pwr.norm.test(d=1/3,power=0.8,sig.level=0.05,alternative="greater")
         #
@@ -596,6 +788,8 @@ class Test_Norm:
         expected = 56
         assert n_results['n'] == expected
 
+    @staticmethod
+    def test_norm_sig_level_result() -> None:
         s_results = pwr_tests.pwr_norm_test(d=0.15, n=20, power=0.8, alternative='less')
         # pwr.norm.test(d=0.15, n=20, power=0.8, alternative='less', sig.level = NULL)
         #
@@ -641,7 +835,14 @@ class Test_P:
             pwr_tests.pwr_p_test(None, 2, 0.05, -0.5, 'two-sided')
 
     @staticmethod
-    def test_p_result() -> None:
+    def test_p_alternative() -> None:
+        with pytest.raises(ValueError, match="alternative must be one of 'two-sided', 'greater' or 'less'"):
+            pwr_tests.pwr_p_test(h=0.2, n=60, sig_level=0.05, alternative='both')
+        r_style = pwr_tests.pwr_p_test(h=0.2, n=60, sig_level=0.05, alternative='two.sided')
+        assert r_style == pwr_tests.pwr_p_test(h=0.2, n=60, sig_level=0.05, alternative='two-sided')
+
+    @staticmethod
+    def test_p_power_result() -> None:
         p_result = pwr_tests.pwr_p_test(h=0.2013579, n=60, sig_level=0.05, alternative='two-sided')
         # pwr.p.test(h=h,n=60,sig.level=0.05,alternative="two.sided")
         #
@@ -655,6 +856,8 @@ class Test_P:
         expected = 0.3447014
         assert p_result['power'] == pytest.approx(expected, 0.000001)
 
+    @staticmethod
+    def test_p_effect_size_result() -> None:
         h_result = pwr_tests.pwr_p_test(n=200, power=0.80, sig_level=0.1, alternative="less")
         # pwr.p.test(n = 200,power=0.80,sig.level=0.1,alternative="less")
         #
@@ -668,6 +871,8 @@ class Test_P:
         expected = -0.150142
         assert h_result['effect_size'] == pytest.approx(expected, 0.0001)
 
+    @staticmethod
+    def test_p_n_result() -> None:
         n_result = pwr_tests.pwr_p_test(h=0.2, power=0.95, sig_level=0.05, alternative="two-sided")
         # pwr.p.test(h=0.2,power=0.95,sig.level=0.05,alternative="two.sided")
         #
@@ -681,6 +886,8 @@ class Test_P:
         expected = 325
         assert n_result['n'] == expected
 
+    @staticmethod
+    def test_p_sig_level_result() -> None:
         s_result = pwr_tests.pwr_p_test(h=0.2, n=150, power=0.95, alternative="greater")
         # pwr.p.test(h=0.2, n=150, power=0.95, alternative="greater", sig.level = NULL)
         #
@@ -726,7 +933,14 @@ class Test_R:
             pwr_tests.pwr_r_test(None, 0.5, 0.05, -0.5, 'two-sided')
 
     @staticmethod
-    def test_r_result() -> None:
+    def test_r_alternative() -> None:
+        with pytest.raises(ValueError, match="alternative must be one of 'two-sided', 'greater' or 'less'"):
+            pwr_tests.pwr_r_test(r=0.3, n=50, sig_level=0.05, alternative='both')
+        r_style = pwr_tests.pwr_r_test(r=0.3, n=50, sig_level=0.05, alternative='two.sided')
+        assert r_style == pwr_tests.pwr_r_test(r=0.3, n=50, sig_level=0.05, alternative='two-sided')
+
+    @staticmethod
+    def test_r_power_result() -> None:
         p_result = pwr_tests.pwr_r_test(r=0.3, n=50, sig_level=0.05, alternative="greater")
         # pwr.r.test(r=0.3,n=50,sig.level=0.05,alternative="greater")
         #
@@ -740,6 +954,8 @@ class Test_R:
         expected = 0.6911395
         assert p_result['power'] == pytest.approx(expected, 0.00001)
 
+    @staticmethod
+    def test_r_effect_size_result() -> None:
         r_result = pwr_tests.pwr_r_test(n=125, power=0.8, sig_level=0.1, alternative="less")
         # pwr.r.test(n=125, power=0.8, sig.level=0.1, alternative="less")
         #
@@ -753,6 +969,8 @@ class Test_R:
         expected = -0.1890504
         assert r_result['effect_size'] == pytest.approx(expected, 0.00001)
 
+    @staticmethod
+    def test_r_n_result() -> None:
         n_result = pwr_tests.pwr_r_test(r=0.3, power=0.80, sig_level=0.05, alternative="two-sided")
         # pwr.r.test(r=0.3,power=0.80,sig.level=0.05,alternative="two.sided")
         #
@@ -766,6 +984,8 @@ class Test_R:
         expected = 85
         assert n_result['n'] == expected
 
+    @staticmethod
+    def test_r_sig_level_result() -> None:
         s_result = pwr_tests.pwr_r_test(r=0.3, n=125, power=0.8, alternative="two-sided")
         # pwr.r.test(r=0.3, n=125, power=0.8, sig.level=NULL, alternative="two.sided")
         #
@@ -779,6 +999,24 @@ class Test_R:
         expected = 0.009736855
         assert s_result['sig_level'] == pytest.approx(expected, abs=0.0001)
 
+    @staticmethod
+    def test_r_less() -> None:
+        greater = pwr_tests.pwr_r_test(r=0.3, power=0.8, sig_level=0.05, alternative='greater')
+        less = pwr_tests.pwr_r_test(r=-0.3, power=0.8, sig_level=0.05, alternative='less')
+        assert less['n'] == greater['n'] == 67
+        assert less['effect_size'] == -0.3
+
+    @staticmethod
+    def test_r_array() -> None:
+        r = np.array([-0.3, 0.1, 0.5])
+        n = np.array([[20], [67]])
+        for alternative in ('two-sided', 'greater', 'less'):
+            results = pwr_tests.pwr_r_test(r=r, n=n, sig_level=0.05, alternative=alternative)
+            assert results['power'].shape == (2, 3)
+            for (i, j), power in np.ndenumerate(results['power']):
+                expected = pwr_tests.pwr_r_test(r=r[j], n=n[i, 0], sig_level=0.05, alternative=alternative)
+                assert power == pytest.approx(expected['power'])
+
 
 class Test_T:
     @staticmethod
@@ -811,7 +1049,30 @@ class Test_T:
             pwr_tests.pwr_t_test(None, 0.5, 0.05, -0.5, 'two', 'two-sided')
 
     @staticmethod
-    def test_t_results() -> None:
+    def test_t_alternative() -> None:
+        with pytest.raises(ValueError, match="alternative must be one of 'two-sided', 'greater' or 'less'"):
+            pwr_tests.pwr_t_test(n=30, d=0.5, sig_level=0.05, alternative='both')
+        r_style = pwr_tests.pwr_t_test(n=30, d=0.5, sig_level=0.05, alternative='two.sided')
+        assert r_style == pwr_tests.pwr_t_test(n=30, d=0.5, sig_level=0.05, alternative='two-sided')
+        assert r_style['power'] == pytest.approx(0.7539647, 0.0001)
+
+    @staticmethod
+    def test_t_negative_d() -> None:
+        # Far out in the tails nctdtr returns nan, which the power must not propagate
+        s_results = pwr_tests.pwr_t_test(d=-0.3, n=200, power=0.5, test_type='paired')
+        assert s_results['sig_level'] == pytest.approx(3.3099e-05, 0.001)
+        assert s_results['effect_size'] == 0.3
+        for test_type in ('paired', 'one-sample', 'two-sample'):
+            two_sided = pwr_tests.pwr_t_test(d=-0.8, n=50, sig_level=1e-6, test_type=test_type)
+            assert two_sided == pwr_tests.pwr_t_test(d=0.8, n=50, sig_level=1e-6, test_type=test_type)
+            assert 0 < two_sided['power'] < 1
+        p_results = pwr_tests.pwr_t_test(d=-0.8, n=50, sig_level=1e-6, test_type='paired')
+        assert p_results['power'] == pytest.approx(0.5343152, 0.0001)
+        g_results = pwr_tests.pwr_t_test(d=-0.8, n=50, sig_level=1e-6, test_type='two-sample', alternative='greater')
+        assert g_results['power'] == pytest.approx(0, abs=1e-12)
+
+    @staticmethod
+    def test_t_power_result() -> None:
         p_results = pwr_tests.pwr_t_test(d=0.2, n=60, sig_level=0.10, test_type="one-sample", alternative="two-sided")
         # pwr.t.test(d=0.2,n=60,sig.level=0.10,type="one.sample",alternative="two.sided")
         #
@@ -825,6 +1086,8 @@ class Test_T:
         expected = 0.4555818
         assert p_results['power'] == pytest.approx(expected, 0.0001)
 
+    @staticmethod
+    def test_t_effect_size_result() -> None:
         d_results = pwr_tests.pwr_t_test(n=100, power=0.8, sig_level=0.05, test_type="paired", alternative="greater")
         # pwr.t.test(n=100,power=0.8,sig.level=0.05,type="paired",alternative="greater")
         #
@@ -840,6 +1103,8 @@ class Test_T:
         expected = 0.2503641
         assert d_results['effect_size'] == pytest.approx(expected, 0.0001)
 
+    @staticmethod
+    def test_t_n_result() -> None:
         n_results = pwr_tests.pwr_t_test(d=0.3, power=0.75, sig_level=0.05, test_type='two-sample', alternative='greater')
         # pwr.t.test(d=0.3,power=0.75,sig.level=0.05,type="two.sample",alternative="greater")
         #
@@ -855,6 +1120,8 @@ class Test_T:
         expected = 121
         assert n_results['n'] == expected
 
+    @staticmethod
+    def test_t_sig_level_result() -> None:
         s_results = pwr_tests.pwr_t_test(d=-0.1, power=0.75, n=100, test_type='paired', alternative='less')
         # pwr.t.test(d=-0.1, power=0.75, n=100, type='paired', alternative='less', sig.level = NULL)
         #
@@ -874,7 +1141,7 @@ class Test_T:
 class Test_T2N:
     @staticmethod
     def test_t2n_noNone() -> None:
-        with pytest.raises(ValueError, match="One of n1, n2, d sig_level or power must be None"):
+        with pytest.raises(ValueError, match="One of n1, n2, d, sig_level or power must be None"):
             pwr_tests.pwr_t2n_test(10, 5, 0.5, 0.05, 0.8, 'two-sided')
 
     @staticmethod
@@ -907,7 +1174,14 @@ class Test_T2N:
             pwr_tests.pwr_t2n_test(None, 15, 0.5, 0.05, -0.5, 'two-sided')
 
     @staticmethod
-    def test_t2n_results() -> None:
+    def test_t2n_alternative() -> None:
+        with pytest.raises(ValueError, match="alternative must be one of 'two-sided', 'greater' or 'less'"):
+            pwr_tests.pwr_t2n_test(n1=90, n2=60, d=0.6, sig_level=0.05, alternative='both')
+        r_style = pwr_tests.pwr_t2n_test(n1=90, n2=60, d=0.6, sig_level=0.05, alternative='two.sided')
+        assert r_style == pwr_tests.pwr_t2n_test(n1=90, n2=60, d=0.6, sig_level=0.05, alternative='two-sided')
+
+    @staticmethod
+    def test_t2n_power_result() -> None:
         p_results = pwr_tests.pwr_t2n_test(d=0.6, n1=90, n2=60, sig_level=0.05, alternative="greater")
         # pwr.t2n.test(d=0.6,n1=90,n2=60,alternative="greater")
         #
@@ -922,6 +1196,8 @@ class Test_T2N:
         expected = 0.9737262
         assert p_results['power'] == pytest.approx(expected, 0.0001)
 
+    @staticmethod
+    def test_t2n_effect_size_result() -> None:
         d_results = pwr_tests.pwr_t2n_test(n1=85, n2=100, sig_level=0.1, power=0.9, alternative='less')
         # pwr.t2n.test(n1=85, n2=100, sig.level=0.1, alternative='less', power=0.9)
         #
@@ -936,6 +1212,8 @@ class Test_T2N:
         expected = -0.3789791
         assert d_results['effect_size'] == pytest.approx(expected, 0.0001)
 
+    @staticmethod
+    def test_t2n_n1_result() -> None:
         n1_results = pwr_tests.pwr_t2n_test(n2=90, sig_level=0.05, d=0.5, power=0.8, alternative='two-sided')
         # pwr.t2n.test(90, sig.level=0.05, d=0.5, power=0.8, alternative='two.sided')
         #
@@ -950,6 +1228,8 @@ class Test_T2N:
         expected = 50
         assert n1_results['n1'] == expected
 
+    @staticmethod
+    def test_t2n_n2_result() -> None:
         n2_results = pwr_tests.pwr_t2n_test(n1=1000, sig_level=0.05, d=0.5, power=0.9, alternative='two-sided')
         # pwr.t2n.test(n1=1000, sig.level=0.05, d=0.5, power=0.9, alternative='two.sided')
         #
@@ -964,6 +1244,8 @@ class Test_T2N:
         expected = 44
         assert n2_results['n2'] == expected
 
+    @staticmethod
+    def test_t2n_sig_level_result() -> None:
         s_results = pwr_tests.pwr_t2n_test(n1=100, n2=200, d=0.2, power=0.8, alternative='greater')
         # pwr.t2n.test(n1=100, n2=200, d=0.2, power=0.8, alternative='greater', sig.level = NULL)
         #